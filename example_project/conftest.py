@@ -1,11 +1,28 @@
 """Pytest configuration for example project."""
 
+import os
 from pathlib import Path
 
 import pytest
 from django.conf import settings
 from django.db import connection
 from django.db.migrations.recorder import MigrationRecorder
+from django.db.models import Q
+
+
+def _get_app_migration_dirs():
+    """Return the migrations directory of each installed project app that has one."""
+    migrations_dirs = []
+    for app_config in settings.INSTALLED_APPS:
+        if "." in app_config:
+            migrations_dir = Path(settings.BASE_DIR) / "example_project" / app_config.split(".")[-1] / "migrations"
+            if migrations_dir.is_dir():
+                migrations_dirs.append(str(migrations_dir))
+    return tuple(migrations_dirs)
+
+
+# INSTALLED_APPS does not change during a test run, so the directories to scan are resolved once at import
+_APP_MIGRATION_DIRS = _get_app_migration_dirs()
 
 
 class MigrationTracker:
@@ -15,79 +32,114 @@ class MigrationTracker:
         """Initialize MigrationTracker."""
         self.initial_migrations = set()
 
+    def _scan(self, migrations_dir):
+        """Return the migration files in a directory."""
+        with os.scandir(migrations_dir) as entries:
+            return {
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".py") and entry.name != "__init__.py" and entry.is_file(follow_symlinks=False)
+            }
+
+    def _current_migrations(self):
+        """Return all migration files currently on disk."""
+        current_migrations = set()
+        for migrations_dir in _APP_MIGRATION_DIRS:
+            current_migrations.update(self._scan(migrations_dir))
+        return current_migrations
+
     def snapshot_migrations(self):
         """Take a snapshot of existing migration files."""
-        self.initial_migrations.clear()
-        for app_config in settings.INSTALLED_APPS:
-            if "." in app_config:
-                app_name = app_config.split(".")[-1]
-                migrations_dir = Path(settings.BASE_DIR) / "example_project" / app_name / "migrations"
-                if migrations_dir.exists():
-                    self.initial_migrations.update(str(f.absolute()) for f in migrations_dir.glob("[0-9]*.py"))
+        self.initial_migrations = self._current_migrations()
 
     def get_new_migrations(self):
         """Get list of migration files created since last snapshot."""
-        current_migrations = set()
-        for app_config in settings.INSTALLED_APPS:
-            if "." in app_config:
-                app_name = app_config.split(".")[-1]
-                migrations_dir = Path(settings.BASE_DIR) / "example_project" / app_name / "migrations"
-                if migrations_dir.exists():
-                    current_migrations.update(str(f.absolute()) for f in migrations_dir.glob("[0-9]*.py"))
-        return current_migrations - self.initial_migrations
+        new_migrations = set()
+        for migrations_dir in _APP_MIGRATION_DIRS:
+            new_migrations.update(
+                migration for migration in self._scan(migrations_dir) if migration not in self.initial_migrations
+            )
+        return new_migrations
+
+
+def pytest_configure(config):
+    """Register the markers used by the example project's tests."""
+    config.addinivalue_line("markers", "creates_migrations: track and clean up migration files created by this test")
 
 
 # Create a single instance to use across tests
 migration_tracker = MigrationTracker()
 
 
+def _recorded_migrations():
+    """Return the (app, name) pairs of all migrations recorded in the database."""
+    return set(MigrationRecorder.Migration.objects.values_list("app", "name"))
+
+
+def _delete_new_migration_records(initial_db_migrations):
+    """Remove migrations recorded since `initial_db_migrations` from the database in a single query."""
+    new_migrations = _recorded_migrations() - initial_db_migrations
+    if new_migrations:
+        new_migrations_query = Q()
+        for app, name in new_migrations:
+            new_migrations_query |= Q(app=app, name=name)
+        MigrationRecorder.Migration.objects.filter(new_migrations_query).delete()
+
+
+def _remove_migration_files(migration_files):
+    """Delete the given migration files, ignoring any that are already gone."""
+    for migration_file in migration_files:
+        try:
+            Path(migration_file).unlink()
+        except FileNotFoundError:
+            pass  # File was already deleted
+
+
 @pytest.fixture(scope="session")
-def django_db_setup(django_db_setup, django_db_blocker):
-    """Setup database for testing and handle migration cleanup."""
+def django_db_setup(django_db_setup, django_db_blocker, request):
+    """Setup database for testing and handle migration cleanup.
+
+    When the test database is built with `--nomigrations`, no migrations are recorded, so the migration records
+    are neither snapshotted nor cleaned up. The (empty) `django_migrations` table is still created, since the
+    trigger management commands read from it.
+
+    Under pytest-xdist, migration files are only cleaned up per test (see `clean_test_migrations`), since another
+    worker may still be using the files its tests created when this worker's session ends.
+    """
+    track_db_migrations = not request.config.getoption("nomigrations")
+    track_migration_files = "PYTEST_XDIST_WORKER" not in os.environ
+
     with django_db_blocker.unblock():
-        # Store initial migration state
-        initial_db_migrations = {
-            (migration.app, migration.name) for migration in MigrationRecorder.Migration.objects.all()
-        }
+        if track_db_migrations:
+            # Store initial migration state
+            initial_db_migrations = _recorded_migrations()
+        else:
+            MigrationRecorder(connection).ensure_schema()
 
         # Take snapshot of migration files
-        migration_tracker.snapshot_migrations()
+        if track_migration_files:
+            migration_tracker.snapshot_migrations()
 
         yield
 
         # Clean up migrations created during testing
-        with connection.cursor() as cursor:
-            # Get current migrations
-            final_migrations = {
-                (migration.app, migration.name) for migration in MigrationRecorder.Migration.objects.all()
-            }
-
-            # Find and remove new migrations from database
-            new_migrations = final_migrations - initial_db_migrations
-            for app, name in new_migrations:
-                cursor.execute("DELETE FROM django_migrations WHERE app = %s AND name = %s", [app, name])
-
-        # Clean up new migration files
-        new_migration_files = migration_tracker.get_new_migrations()
-        for migration_file in new_migration_files:
-            try:
-                Path(migration_file).unlink()
-            except FileNotFoundError:
-                pass  # File was already deleted
+        if track_db_migrations:
+            _delete_new_migration_records(initial_db_migrations)
+        if track_migration_files:
+            _remove_migration_files(migration_tracker.get_new_migrations())
 
 
 @pytest.fixture(autouse=True)
-def clean_test_migrations():
-    """Track and clean migrations for each test."""
+def clean_test_migrations(request):
+    """Track and clean migrations for tests marked with `creates_migrations`."""
+    if request.node.get_closest_marker("creates_migrations") is None:
+        yield
+        return
+
     # Take snapshot before test
     migration_tracker.snapshot_migrations()
 
     yield
 
     # Clean up new migration files after test
-    new_migration_files = migration_tracker.get_new_migrations()
-    for migration_file in new_migration_files:
-        try:
-            Path(migration_file).unlink()
-        except FileNotFoundError:
-            pass
+    _remove_migration_files(migration_tracker.get_new_migrations())
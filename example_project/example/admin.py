@@ -2,6 +2,7 @@
 
 from django.apps import apps
 from django.contrib import admin
+from django.utils.functional import cached_property
 
 from example_project.example.models import Task
 from example_project.example.models import TaskPrioritySelection
@@ -12,6 +13,7 @@ class TaskAdmin(admin.ModelAdmin):
     """Admin class for the Task model."""
 
     list_display = ("title", "description", "status", "priority")
+    list_select_related = ("status", "priority")
 
     def get_form(self, request, obj=None, change=False, **kwargs):
         """Override get_form to filter the priority and status fields by tenant."""
@@ -31,16 +33,32 @@ admin.site.register(Task, TaskAdmin)
 class ListAdminMixin:
     """Mixin to automatically set list_display to all fields on a model."""
 
-    def __init__(self, model, admin_site):
-        """Set list_display to all fields on the model."""
-        self.list_display = [field.name for field in model._meta.fields]
-        super().__init__(model, admin_site)
+    @cached_property
+    def all_field_names(self):
+        """Names of all concrete fields on the model."""
+        return tuple(field.name for field in self.model._meta.concrete_fields)
 
+    @cached_property
+    def related_field_names(self):
+        """Names of all forward foreign key and one-to-one fields on the model."""
+        return tuple(field.name for field in self.model._meta.concrete_fields if field.is_relation)
 
-# Register all models from the example app with the ListAdminMixin
+    def get_list_display(self, request):
+        """Display all fields on the model."""
+        return self.all_field_names
+
+    def get_list_select_related(self, request):
+        """Join every related field shown in the list, including nullable ones, to avoid a query per row."""
+        return self.related_field_names
+
+
+class ListAdmin(ListAdminMixin, admin.ModelAdmin):
+    """Admin class that displays all fields on a model."""
+
+
+# Register all models from the example app with the ListAdmin
 for model in apps.get_app_config("example").get_models():
-    AdminClass = type("AdminClass", (ListAdminMixin, admin.ModelAdmin), {})
     try:
-        admin.site.register(model, AdminClass)
+        admin.site.register(model, ListAdmin)
     except admin.sites.AlreadyRegistered:
         pass
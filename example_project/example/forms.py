@@ -5,7 +5,6 @@ from crispy_forms.layout import HTML
 from crispy_forms.layout import Fieldset
 from crispy_forms.layout import Layout
 from crispy_forms.layout import Submit
-from django.contrib.auth import get_user_model
 from django.forms import Form
 from django.forms import ModelForm
 from django.forms.widgets import HiddenInput
@@ -23,12 +22,59 @@ from .models import TaskStatusSelection
 from .models import Tenant
 
 
-User = get_user_model()
+OPTION_NOTE = HTML("<p>Note: Only custom Options can be created or updated here.</p>")
 
 
-class TaskForm(UserFacingFormMixin, ModelForm):
+class CrispyFormMixin:
+    """Provides a crispy-forms helper that renders all of the form's fields in a single Fieldset.
+
+    Helpers are built the first time a form is rendered, after any fields have been added or removed in `__init__`,
+    and are then shared by every instance of the same form class with the same fields.
+    """
+
+    form_title = ""
+    form_notes = ()
+
+    _helpers = {}
+
+    @property
+    def helper(self):
+        """Return the FormHelper for this form."""
+        key = (type(self), tuple(self.fields))
+        helper = self._helpers.get(key)
+        if helper is None:
+            helper = self._helpers[key] = self._build_helper()
+        return helper
+
+    def _build_helper(self):
+        """Build the FormHelper for this form's fields.
+
+        Forms without any fields only get the submit button, rather than an empty Fieldset.
+        """
+        helper = FormHelper()
+        # The templates provide the <form> tag and csrf token
+        helper.form_tag = False
+        submit = Submit("submit", "Submit", css_class="button white")
+        if not self.fields:
+            helper.layout = Layout(submit)
+            return helper
+
+        helper.layout = Layout(
+            Fieldset(
+                self.form_title,
+                *self.form_notes,
+                *self.fields.keys(),
+            ),
+            submit,
+        )
+        return helper
+
+
+class TaskForm(CrispyFormMixin, UserFacingFormMixin, ModelForm):
     """Form for creating Task instances."""
 
+    form_title = "Create or Update Task"
+
     class Meta:
         """Meta class for TaskForm."""
 
@@ -40,53 +86,38 @@ class TaskForm(UserFacingFormMixin, ModelForm):
         self.request = kwargs.pop("request", None)
         super().__init__(*args, **kwargs)
 
-        self.data = self.data.copy()
-        self.data.update(user=User.objects.filter(id=self.request.user.id).first().pk)
+        # The user always comes from the request; as the field is disabled, any submitted value is ignored
+        self.fields["user"].disabled = True
+        self.fields["user"].initial = self.request.user.pk
         self.fields["user"].widget = HiddenInput()
 
-        self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Fieldset(
-                "Create or Update Task",
-                *self.fields.keys(),
-            ),
-            Submit("submit", "Submit", css_class="button white"),
-        )
-
     def save(self, commit=True):
         """Save the Task instance."""
         task = super().save(commit=False)
-        task.user = User.objects.filter(id=self.request.user.id).first()
+        task.user = self.request.user
         if commit:
             task.save()
         return task
 
 
-class TenantForm(ModelForm):
+class TenantForm(CrispyFormMixin, ModelForm):
     """Form for creating Tenant instances."""
 
+    form_title = "Create or Update Tenant"
+
     class Meta:
         """Meta class for TenantForm."""
 
         model = Tenant
         fields = "__all__"
 
-    def __init__(self, *args, **kwargs):
-        """Initialize TenantForm."""
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Fieldset(
-                "Create or Update Tenant",
-                *self.fields.keys(),
-            ),
-            Submit("submit", "Submit", css_class="button white"),
-        )
 
-
-class TaskStatusOptionCreateForm(OptionCreateFormMixin, ModelForm):
+class TaskStatusOptionCreateForm(CrispyFormMixin, OptionCreateFormMixin, ModelForm):
     """Form for creating TaskStatusOption instances."""
 
+    form_title = "Create or Update Task Status Option"
+    form_notes = (OPTION_NOTE,)
+
     class Meta:
         """Meta class for TaskStatusOptionCreateForm."""
 
@@ -94,23 +125,13 @@ class TaskStatusOptionCreateForm(OptionCreateFormMixin, ModelForm):
         # Speifying the fields explicitly
         fields = ["name", "option_type", "tenant", "deleted"]
 
-    def __init__(self, *args, **kwargs):
-        """Initialize TaskStatusOptionCreateForm."""
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Fieldset(
-                "Create or Update Task Status Option",
-                HTML("<p>Note: Only custom Options can be created or updated here.</p>"),
-                *self.fields.keys(),
-            ),
-            Submit("submit", "Submit", css_class="button white"),
-        )
-
 
-class TaskStatusOptionUpdateForm(OptionUpdateFormMixin, ModelForm):
+class TaskStatusOptionUpdateForm(CrispyFormMixin, OptionUpdateFormMixin, ModelForm):
     """Form for updating TaskStatusOption instances."""
 
+    form_title = "Create or Update Task Status Option"
+    form_notes = (OPTION_NOTE,)
+
     class Meta:
         """Meta class for TaskStatusOptionUpdateForm.
 
@@ -121,46 +142,26 @@ class TaskStatusOptionUpdateForm(OptionUpdateFormMixin, ModelForm):
         # Specifying the fields implicitly
         fields = "__all__"
 
-    def __init__(self, *args, **kwargs):
-        """Initialize TaskStatusOptionUpdateForm."""
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Fieldset(
-                "Create or Update Task Status Option",
-                HTML("<p>Note: Only custom Options can be created or updated here.</p>"),
-                *self.fields.keys(),
-            ),
-            Submit("submit", "Submit", css_class="button white"),
-        )
 
-
-class TaskPriorityOptionCreateForm(OptionCreateFormMixin, ModelForm):
+class TaskPriorityOptionCreateForm(CrispyFormMixin, OptionCreateFormMixin, ModelForm):
     """Form for creating TaskPriorityOption instances."""
 
+    form_title = "Create or Update Task Priority Option"
+    form_notes = (OPTION_NOTE,)
+
     class Meta:
         """Meta class for TaskPriorityOptionCreateForm."""
 
         model = TaskPriorityOption
         fields = "__all__"
 
-    def __init__(self, *args, **kwargs):
-        """Initialize TaskPriorityOptionCreateForm."""
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Fieldset(
-                "Create or Update Task Priority Option",
-                HTML("<p>Note: Only custom Options can be created or updated here.</p>"),
-                *self.fields.keys(),
-            ),
-            Submit("submit", "Submit", css_class="button white"),
-        )
-
 
-class TaskPriorityOptionUpdateForm(OptionUpdateFormMixin, ModelForm):
+class TaskPriorityOptionUpdateForm(CrispyFormMixin, OptionUpdateFormMixin, ModelForm):
     """Form for updating TaskPriorityOption instances."""
 
+    form_title = "Create or Update Task Priority Option"
+    form_notes = (OPTION_NOTE,)
+
     class Meta:
         """Meta class for TaskPriorityOptionUpdateForm.
 
@@ -170,23 +171,12 @@ class TaskPriorityOptionUpdateForm(OptionUpdateFormMixin, ModelForm):
         model = TaskPriorityOption
         fields = "__all__"
 
-    def __init__(self, *args, **kwargs):
-        """Initialize TaskPriorityOptionUpdateForm."""
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Fieldset(
-                "Create or Update Task Priority Option",
-                HTML("<p>Note: Only custom Options can be created or updated here.</p>"),
-                *self.fields.keys(),
-            ),
-            Submit("submit", "Submit", css_class="button white"),
-        )
-
 
-class TaskStatusSelectionForm(SelectionsForm):
+class TaskStatusSelectionForm(CrispyFormMixin, SelectionsForm):
     """Form for creating TaskStatusSelection instances."""
 
+    form_title = "Update Task Status Selections"
+
     class Meta:
         """Meta class for TaskStatusSelectionForm."""
 
@@ -200,37 +190,18 @@ class TaskStatusSelectionForm(SelectionsForm):
         # Example increasing widget size
         self.fields["selections"].widget.attrs["size"] = "10"
 
-        self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Fieldset(
-                "Update Task Status Selections",
-                *self.fields.keys(),
-            ),
-            Submit("submit", "Submit", css_class="button white"),
-        )
-
 
-class TaskPrioritySelectionForm(SelectionsForm):
+class TaskPrioritySelectionForm(CrispyFormMixin, SelectionsForm):
     """Form for creating TaskPrioritySelection instances."""
 
+    form_title = "Update Task Priority Selections"
+
     class Meta:
         """Meta class for TaskPrioritySelectionForm."""
 
         model = TaskPrioritySelection
         # We do not need to specify the fields, as they are automatically generated based on the model.
 
-    def __init__(self, *args, **kwargs):
-        """Initialize TaskPrioritySelectionForm."""
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Fieldset(
-                "Update Task Priority Selections",
-                *self.fields.keys(),
-            ),
-            Submit("submit", "Submit", css_class="button white"),
-        )
-
 
 class EndUserForm(Form):
     """Form for viewing a form from an end-user perspective."""
@@ -2,6 +2,9 @@
 
 import logging
 
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
 from django.shortcuts import render
@@ -26,23 +29,68 @@ from .models import Tenant
 logger = logging.getLogger("django_tenant_options")
 
 
+@sync_to_async
+def _load_user(request):
+    """Load the request's user and their tenant outside of the event loop, for use in async views.
+
+    Both are cached on `request.user`, so the templates can use them without further queries.
+    """
+    user = request.user
+    user.tenant  # pylint: disable=W0104
+    return user
+
+
+def _form_view(request, form_class, success_url, /, instance_queryset=None, **form_kwargs):
+    """Display `form_class` using the shared form template, saving it and redirecting to `success_url` once valid.
+
+    `form_kwargs` are passed to the form on both GET and POST requests. The leading arguments are positional-only, so
+    forms that take a `request` keyword argument can be passed one.
+
+    For update views, `instance_queryset` should match the single object being edited. On POST, the object is locked
+    with `select_for_update()` and the form is validated and saved in the same transaction.
+    """
+    if request.method == "POST":
+        with transaction.atomic():
+            if instance_queryset is not None:
+                form_kwargs["instance"] = get_object_or_404(instance_queryset.select_for_update())
+            form = form_class(request.POST, **form_kwargs)
+            if form.is_valid():
+                form.save()
+                return redirect(success_url)
+    else:
+        if instance_queryset is not None:
+            form_kwargs["instance"] = get_object_or_404(instance_queryset)
+        form = form_class(**form_kwargs)
+
+    return TemplateResponse(request, "example/form.html", {"form": form})
+
+
 def home(request):
     """Home view shows a list of urls to navigate the example app.
 
     In this view, we also set the current Tenant for the User if it is not already set, for example purposes only.
     """
-    if not request.user.tenant:
-        request.user.tenant = Tenant.objects.first()
-        request.user.save()
+    if request.user.tenant_id is None:
+        # first() orders by primary key, so the lookup uses the primary key index
+        tenant_id = Tenant.objects.values_list("id", flat=True).first()
+        if tenant_id is not None:
+            request.user.tenant_id = tenant_id
+            request.user.save(update_fields=["tenant"])
     return render(request, "example/home.html")
 
 
-def task_list(request):
+async def task_list(request):
     """Lists all Tasks for the current Tenant."""
     template = "example/task_list.html"
     context = {}
+    user = await _load_user(request)
 
-    tasks = Task.objects.filter(user=request.user)
+    # Only the columns the template shows are fetched, with each task's priority and status joined in the same query
+    tasks = (
+        Task.objects.filter(user=user)
+        .select_related("priority", "status")
+        .only("title", "user", "priority__name", "status__name")
+    )
 
     context["tasks"] = tasks
 
@@ -51,58 +99,38 @@ def task_list(request):
 
 def task_create(request):
     """Creates a Task for the current Tenant."""
-    template = "example/form.html"
-    context = {}
-
-    if request.method == "POST":
-        form = TaskForm(request.POST, tenant=request.user.tenant, request=request)
-        if form.is_valid():
-            form.save()
-            return redirect("example:task_list")
-    else:
-        form = TaskForm(tenant=request.user.tenant, request=request)
-
-    context["form"] = form
-
-    return TemplateResponse(request, template, context)
+    return _form_view(request, TaskForm, "example:task_list", tenant=request.user.tenant, request=request)
 
 
 def task_update(request, task_id):
     """Updates a Task for the current Tenant."""
-    template = "example/form.html"
-    context = {}
-
-    task = get_object_or_404(Task, id=task_id)
-
-    if request.method == "POST":
-        form = TaskForm(request.POST, instance=task, tenant=request.user.tenant, request=request)
-        if form.is_valid():
-            form.save()
-            return redirect("example:task_list")
-    else:
-        form = TaskForm(instance=task, tenant=request.user.tenant, request=request)
-
-    context["form"] = form
-
-    return TemplateResponse(request, template, context)
+    return _form_view(
+        request,
+        TaskForm,
+        "example:task_list",
+        instance_queryset=Task.objects.filter(id=task_id),
+        tenant=request.user.tenant,
+        request=request,
+    )
 
 
 def user_tenant_update(request, tenant_id):
     """Updates a Tenant for the current User."""
 
-    tenant = get_object_or_404(Tenant, id=tenant_id)
-    request.user.tenant = tenant
-    request.user.save()
+    if not Tenant.objects.filter(id=tenant_id).exists():
+        raise Http404(_("No Tenant matches the given query."))
+    request.user.tenant_id = tenant_id
+    request.user.save(update_fields=["tenant"])
 
     return redirect("example:tenant_list")
 
 
-def tenant_list(request):
+async def tenant_list(request):
     """Lists all Tenants."""
     template = "example/tenant_list.html"
     context = {}
 
-    tenants = Tenant.objects.all()
+    tenants = Tenant.objects.only("name")
 
     context["tenants"] = tenants
 
@@ -111,67 +139,47 @@ def tenant_list(request):
 
 def tenant_create(request):
     """Creates a Tenant."""
-    template = "example/form.html"
-    context = {}
-
-    if request.method == "POST":
-        form = TenantForm(request.POST)
-        if form.is_valid():
-            form.save()
-            return redirect("example:tenant_list")
-    else:
-        form = TenantForm()
-
-    context["form"] = form
-
-    return TemplateResponse(request, template, context)
+    return _form_view(request, TenantForm, "example:tenant_list")
 
 
 def tenant_update(request, tenant_id):
     """Updates a Tenant."""
-    template = "example/form.html"
-    context = {}
-
-    tenant = get_object_or_404(Tenant, id=tenant_id)
-
-    if request.method == "POST":
-        form = TenantForm(request.POST, instance=tenant)
-        if form.is_valid():
-            form.save()
-            return redirect("example:tenant_list")
-    else:
-        form = TenantForm(instance=tenant)
-
-    context["form"] = form
+    return _form_view(request, TenantForm, "example:tenant_list", instance_queryset=Tenant.objects.filter(id=tenant_id))
 
-    return TemplateResponse(request, template, context)
 
-
-def task_priority_list(request):
+async def task_priority_list(request):
     """Lists all TaskPriorityOption and TaskPrioritySelection for the current Tenant."""
     template = "example/task_priority_list.html"
     context = {}
+    tenant = (await _load_user(request)).tenant
 
-    task_priority_options = TaskPriorityOption.objects.options_for_tenant(request.user.tenant)
+    # Both lists show each option's tenant, so it is fetched in the same query
+    task_priority_options = TaskPriorityOption.objects.options_for_tenant(tenant).select_related("tenant")
     context["task_priority_options"] = task_priority_options
 
-    task_priority_selections = TaskPrioritySelection.objects.selected_options_for_tenant(
-        tenant=request.user.tenant
-    ).filter(deleted__isnull=True)
+    task_priority_selections = (
+        TaskPrioritySelection.objects.selected_options_for_tenant(tenant=tenant)
+        .filter(deleted__isnull=True)
+        .select_related("tenant")
+    )
     context["task_priority_selections"] = task_priority_selections
 
     return TemplateResponse(request, template, context)
 
 
-def task_status_list(request):
+async def task_status_list(request):
     """Lists all TaskStatusOption and TaskStatusSelection for the current Tenant."""
     template = "example/task_status_list.html"
     context = {}
+    tenant = (await _load_user(request)).tenant
 
-    task_status_options = TaskStatusOption.objects.options_for_tenant(request.user.tenant)
+    # Both lists show each option's tenant, so it is fetched in the same query
+    task_status_options = TaskStatusOption.objects.options_for_tenant(tenant).select_related("tenant")
     context["task_status_options"] = task_status_options
 
-    task_status_selections = TaskStatusSelection.objects.selected_options_for_tenant(tenant=request.user.tenant)
+    task_status_selections = TaskStatusSelection.objects.selected_options_for_tenant(tenant=tenant).select_related(
+        "tenant"
+    )
     context["task_status_selections"] = task_status_selections
 
     return TemplateResponse(request, template, context)
@@ -179,112 +187,44 @@ def task_status_list(request):
 
 def task_priority_option_create(request):
     """Creates a TaskPriorityOption for the current Tenant."""
-    template = "example/form.html"
-    context = {}
-
-    if request.method == "POST":
-        form = TaskPriorityOptionCreateForm(request.POST, tenant=request.user.tenant)
-        if form.is_valid():
-            form.save()
-            return redirect("example:task_priority_list")
-    else:
-        form = TaskPriorityOptionCreateForm(tenant=request.user.tenant)
-
-    context["form"] = form
-
-    return TemplateResponse(request, template, context)
+    return _form_view(request, TaskPriorityOptionCreateForm, "example:task_priority_list", tenant=request.user.tenant)
 
 
 def task_priority_option_update(request, task_priority_option_id):
     """Updates a TaskPriorityOption for the current Tenant."""
-    template = "example/form.html"
-    context = {}
+    tenant = request.user.tenant
+    logger.debug(f"Current tenant: {tenant}")
 
-    task_priority_option = get_object_or_404(TaskPriorityOption, id=task_priority_option_id)
-    logger.debug(f"Current tenant: {request.user.tenant}")
-
-    if request.method == "POST":
-        form = TaskStatusOptionUpdateForm(request.POST, instance=task_priority_option, tenant=request.user.tenant)
-        if form.is_valid():
-            form.save()
-            return redirect("example:task_priority_list")
-    else:
-        form = TaskStatusOptionUpdateForm(instance=task_priority_option, tenant=request.user.tenant)
-
-    context["form"] = form
-
-    return TemplateResponse(request, template, context)
+    return _form_view(
+        request,
+        TaskStatusOptionUpdateForm,
+        "example:task_priority_list",
+        instance_queryset=TaskPriorityOption.objects.filter(id=task_priority_option_id),
+        tenant=tenant,
+    )
 
 
 def task_status_option_create(request):
     """Creates a TaskStatusOption for the current Tenant."""
-    template = "example/form.html"
-    context = {}
-
-    if request.method == "POST":
-        form = TaskStatusOptionCreateForm(request.POST, tenant=request.user.tenant)
-        if form.is_valid():
-            form.save()
-            return redirect("example:task_status_list")
-    else:
-        form = TaskStatusOptionCreateForm(tenant=request.user.tenant)
-
-    context["form"] = form
-
-    return TemplateResponse(request, template, context)
+    return _form_view(request, TaskStatusOptionCreateForm, "example:task_status_list", tenant=request.user.tenant)
 
 
 def task_status_option_update(request, task_status_option_id):
     """Updates a TaskStatusOption for the current Tenant."""
-    template = "example/form.html"
-    context = {}
-
-    task_status_option = get_object_or_404(TaskStatusOption, id=task_status_option_id)
-
-    if request.method == "POST":
-        form = TaskStatusOptionCreateForm(request.POST, instance=task_status_option, tenant=request.user.tenant)
-        if form.is_valid():
-            form.save()
-            return redirect("example:task_status_list")
-    else:
-        form = TaskStatusOptionCreateForm(instance=task_status_option, tenant=request.user.tenant)
-
-    context["form"] = form
-
-    return TemplateResponse(request, template, context)
+    return _form_view(
+        request,
+        TaskStatusOptionCreateForm,
+        "example:task_status_list",
+        instance_queryset=TaskStatusOption.objects.filter(id=task_status_option_id),
+        tenant=request.user.tenant,
+    )
 
 
 def task_priority_selections_update(request):
     """Creates a TaskPrioritySelection for the current Tenant."""
-    template = "example/form.html"
-    context = {}
-
-    if request.method == "POST":
-        form = TaskPrioritySelectionForm(request.POST, tenant=request.user.tenant)
-        if form.is_valid():
-            form.save()
-            return redirect("example:task_priority_list")
-    else:
-        form = TaskPrioritySelectionForm(tenant=request.user.tenant)
-
-    context["form"] = form
-
-    return TemplateResponse(request, template, context)
+    return _form_view(request, TaskPrioritySelectionForm, "example:task_priority_list", tenant=request.user.tenant)
 
 
 def task_status_selections_update(request):
     """Creates a TaskStatusSelection for the current Tenant."""
-    template = "example/form.html"
-    context = {}
-
-    if request.method == "POST":
-        form = TaskStatusSelectionForm(request.POST, tenant=request.user.tenant)
-        if form.is_valid():
-            form.save()
-            return redirect("example:task_status_list")
-    else:
-        form = TaskStatusSelectionForm(tenant=request.user.tenant)
-
-    context["form"] = form
-
-    return TemplateResponse(request, template, context)
+    return _form_view(request, TaskStatusSelectionForm, "example:task_status_list", tenant=request.user.tenant)
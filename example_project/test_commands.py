@@ -1,5 +1,7 @@
 """Test cases for management commands with migration cleanup."""
 
+from dataclasses import dataclass
+from datetime import timedelta
 from io import StringIO
 from pathlib import Path
 
@@ -9,6 +11,14 @@ from django.core.management import call_command
 from django.db.migrations.recorder import MigrationRecorder
 from django.utils import timezone
 
+from django_tenant_options.choices import OptionType
+from django_tenant_options.management.commands.maketriggers import (
+    Command as MakeTriggersCommand,
+)
+from django_tenant_options.management.commands.removetriggers import (
+    Command as RemoveTriggersCommand,
+)
+from django_tenant_options.management.commands.removetriggers import TriggerInfo
 from example_project.example.models import TaskPriorityOption
 from example_project.example.models import Tenant
 
@@ -21,14 +31,8 @@ def deleted_priority():
     return option
 
 
-@pytest.fixture
-def mock_migrations_dir(tmp_path):
-    """Create a temporary migrations directory with mock migration files."""
-    migrations_dir = tmp_path / "migrations"
-    migrations_dir.mkdir()
-
-    # Create a mock migration file with trigger creation
-    migration_content = """
+# A mock migration file with trigger creation
+MOCK_INITIAL_MIGRATION = """
 from django.db import migrations
 
 class Migration(migrations.Migration):
@@ -44,10 +48,9 @@ class Migration(migrations.Migration):
         ),
     ]
 """
-    (migrations_dir / "0001_initial.py").write_text(migration_content)
 
-    # Create a second migration file
-    second_migration = """
+# A second mock migration file
+MOCK_ADDITIONAL_MIGRATION = """
 from django.db import migrations
 
 class Migration(migrations.Migration):
@@ -59,10 +62,33 @@ class Migration(migrations.Migration):
         ),
     ]
 """
-    (migrations_dir / "0002_additional.py").write_text(second_migration)
+
+
+@pytest.fixture
+def mock_migrations_dir(tmp_path):
+    """Create a temporary migrations directory with mock migration files.
+
+    This is function-scoped because some tests run removetriggers against it, which may write a new migration.
+    """
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    (migrations_dir / "0001_initial.py").write_text(MOCK_INITIAL_MIGRATION)
+    (migrations_dir / "0002_additional.py").write_text(MOCK_ADDITIONAL_MIGRATION)
     return migrations_dir
 
 
+@pytest.fixture(scope="module")
+def example_app_config():
+    """The example app's AppConfig, looked up once for the module."""
+    return apps.get_app_config("example")
+
+
+@pytest.fixture(scope="module")
+def mock_empty_migrations_dir(tmp_path_factory):
+    """Create an empty migrations directory, shared by the tests in this module since none of them write to it."""
+    return tmp_path_factory.mktemp("empty_migrations")
+
+
 @pytest.mark.django_db
 class TestListOptionsCommand:
     """Test cases for the listoptions management command."""
@@ -129,8 +155,11 @@ class TestSyncOptionsCommand:
 
     def test_syncoptions_delete_removed_defaults(self, monkeypatch):
         """Test syncoptions command handling removed default options."""
-        # First create some default options
-        TaskPriorityOption.objects.create_optional("Old Option")
+        # First create some default options, in a single query
+        old_option_names = ["Old Option", "Older Option", "Oldest Option"]
+        TaskPriorityOption.objects.bulk_create(
+            [TaskPriorityOption(name=name, option_type=OptionType.OPTIONAL) for name in old_option_names]
+        )
 
         # Now set new defaults that don't include the old option
         monkeypatch.setattr(TaskPriorityOption, "default_options", {"New Option": {"option_type": "do"}})
@@ -141,10 +170,11 @@ class TestSyncOptionsCommand:
 
         # Verify output shows the deleted options
         assert "Newly Deleted Options" in output
-        assert "Old Option" in output
+        for name in old_option_names:
+            assert name in output
 
-        # Verify the old option is now marked as deleted
-        assert TaskPriorityOption.objects.deleted().filter(name="Old Option").exists()
+        # Verify the old options are now marked as deleted
+        assert TaskPriorityOption.objects.deleted().filter(name__in=old_option_names).count() == len(old_option_names)
 
     def test_syncoptions_with_custom_options(self, tenant, custom_priority):
         """Test syncoptions command handling custom options."""
@@ -188,9 +218,7 @@ class TestRemoveTriggersCommand:
     @pytest.fixture
     def command(self):
         """Create a Command instance for testing."""
-        from django_tenant_options.management.commands.removetriggers import Command
-
-        cmd = Command()
+        cmd = RemoveTriggersCommand()
         cmd.stdout = StringIO()
         return cmd
 
@@ -207,13 +235,6 @@ class TestRemoveTriggersCommand:
             "verify": False,
         }
 
-    @pytest.fixture
-    def mock_empty_migrations_dir(self, tmp_path):
-        """Create an empty migrations directory."""
-        migrations_dir = tmp_path / "empty_migrations"
-        migrations_dir.mkdir()
-        return migrations_dir
-
     def test_find_triggers_empty_directory(self, command, mock_empty_migrations_dir):
         """Test finding triggers in an empty migrations directory."""
 
@@ -247,8 +268,6 @@ class TestRemoveTriggersCommand:
 
     def test_migration_content_generation(self, command, mock_migrations_dir):
         """Test generation of migration file content."""
-        from django_tenant_options.management.commands.removetriggers import TriggerInfo
-
         triggers = {
             TriggerInfo(
                 trigger_name="test_trigger",
@@ -268,6 +287,28 @@ class TestRemoveTriggersCommand:
         assert "DROP TRIGGER IF EXISTS test_trigger" in content
         assert "reverse_sql=''" in content  # Check for empty reverse SQL
 
+    def test_migration_content_multiple_triggers(self, command):
+        """Test that each removed trigger gets its own, correctly indented operation."""
+        triggers = {
+            TriggerInfo(
+                trigger_name=f"test_trigger_{i}",
+                migration_file=Path("test_migration.py"),
+                model_name="TestModel",
+                app_label="example",
+            )
+            for i in range(3)
+        }
+
+        content = command._generate_migration_content("example", triggers)
+
+        # The generated migration must be valid Python
+        compile(content, "migration.py", "exec")
+
+        lines = content.splitlines()
+        assert lines.count("        migrations.RunSQL(") == 3
+        for i in range(3):
+            assert f"            sql='DROP TRIGGER IF EXISTS test_trigger_{i};'," in lines
+
     def test_process_triggers_no_triggers(self, command):
         """Test processing when no triggers are found."""
 
@@ -320,8 +361,6 @@ class TestRemoveTriggersCommand:
 
     def test_create_removal_migration_dry_run_verbose(self, command, mock_migrations_dir):
         """Test creation of removal migration in dry run mode with verbose output."""
-        from django_tenant_options.management.commands.removetriggers import TriggerInfo
-
         command.dry_run = True
         command.verbose = True
         out = StringIO()
@@ -357,8 +396,16 @@ class TestRemoveTriggersCommand:
     def test_migration_dependencies_handling(self, command, mock_migrations_dir):
         """Test proper handling of migration dependencies."""
         # Create some test migrations in the database
-        MigrationRecorder.Migration.objects.create(app="example", name="0001_initial", applied=timezone.now())
-        MigrationRecorder.Migration.objects.create(app="example", name="0002_additional", applied=timezone.now())
+        # The command picks the most recently applied migration, so the two need distinct timestamps
+        applied = timezone.now()
+        MigrationRecorder.Migration.objects.bulk_create(
+            [
+                MigrationRecorder.Migration(app="example", name="0001_initial", applied=applied),
+                MigrationRecorder.Migration(
+                    app="example", name="0002_additional", applied=applied + timedelta(seconds=1)
+                ),
+            ]
+        )
 
         name = command._construct_migration_name("example")
 
@@ -389,6 +436,7 @@ class TestRemoveTriggersCommand:
 
         assert "No triggers found to remove" in output or "[DRY RUN]" in output
 
+    @pytest.mark.creates_migrations
     def test_verbose_output(self):
         """Test verbose output mode."""
         out = StringIO()
@@ -412,8 +460,6 @@ class TestRemoveTriggersCommand:
 
     def test_trigger_info_equality(self):
         """Test TriggerInfo equality comparison."""
-        from django_tenant_options.management.commands.removetriggers import TriggerInfo
-
         trigger1 = TriggerInfo("trigger1", Path("migration1.py"), "Model1", "example")
         trigger2 = TriggerInfo("trigger1", Path("migration1.py"), "Model1", "example")
         trigger3 = TriggerInfo("trigger2", Path("migration1.py"), "Model1", "example")
@@ -435,6 +481,7 @@ class TestRemoveTriggersCommand:
 
     def test_migration_name_construction(self, command):
         """Test migration name construction."""
+        MigrationRecorder.Migration.objects.create(app="example", name="0001_initial", applied=timezone.now())
 
         name = command._construct_migration_name("example")
 
@@ -463,6 +510,22 @@ class TestRemoveTriggersCommand:
         assert list(custom_dir.glob("*.py")) == []  # No migrations should be created in dry run
 
 
+@dataclass(frozen=True)
+class MockContext:
+    """Mock context for the maketriggers command."""
+
+    trigger_name: str = "test_trigger"
+    db_table: str = "test_table"
+    model_name: str = "test_model"
+    app_label: str = "test_app"
+
+
+@pytest.fixture(scope="module")
+def shared_mock_context():
+    """A MockContext shared by the maketriggers tests, which only read from it."""
+    return MockContext()
+
+
 @pytest.mark.django_db
 class TestMakeTriggersCommand:
     """Test suite for the maketriggers management command."""
@@ -470,27 +533,17 @@ class TestMakeTriggersCommand:
     @pytest.fixture
     def command(self):
         """Create a Command instance for testing."""
-        from django_tenant_options.management.commands.maketriggers import Command
-
-        cmd = Command()
+        cmd = MakeTriggersCommand()
         cmd.stdout = StringIO()
         return cmd
 
     @pytest.fixture
-    def mock_context(self, command):
-        """Create a mock context for the command."""
-
-        class MockContext:
-            """Mock context for the command."""
-
-            trigger_name = "test_trigger"
-            db_table = "test_table"
-            model_name = "test_model"
-            app_label = "test_app"
-
-        command.context = MockContext()
+    def mock_context(self, command, shared_mock_context):
+        """Set the shared mock context on the command."""
+        command.context = shared_mock_context
         return command.context
 
+    @pytest.mark.creates_migrations
     def test_maketriggers_command(self):
         """Test the maketriggers command."""
         out = StringIO()
@@ -532,26 +585,22 @@ class TestMakeTriggersCommand:
         assert "test_trigger" in oracle_sql
         assert "test_table" in oracle_sql
 
-    def test_handle_app_models(self, command, monkeypatch):
+    def test_handle_app_models(self, command, monkeypatch, example_app_config):
         """Test handling of app models."""
-        from django_tenant_options.management.commands.maketriggers import Command
-
         process_called = []
 
         def mock_process_app_models(self, app_config):
             """Mock method to append processed app models."""
             process_called.append(app_config)
 
-        monkeypatch.setattr(Command, "_process_app_models", mock_process_app_models)
+        monkeypatch.setattr(MakeTriggersCommand, "_process_app_models", mock_process_app_models)
         command._handle_app_models("example")
 
         assert len(process_called) == 1
-        assert process_called[0] == apps.get_app_config("example")
+        assert process_called[0] == example_app_config
 
     def test_handle_dry_run(self, command, mock_context, monkeypatch):
         """Test dry run handling."""
-        from django_tenant_options.management.commands.maketriggers import Command
-
         migration_path = Path("/test/path/migration.py")
         command.verbose = True
 
@@ -559,7 +608,7 @@ class TestMakeTriggersCommand:
             """Mock method to return migration content."""
             return "Migration content"
 
-        monkeypatch.setattr(Command, "_get_migration_content", mock_get_migration_content)
+        monkeypatch.setattr(MakeTriggersCommand, "_get_migration_content", mock_get_migration_content)
         command._handle_dry_run(migration_path)
 
         output = command.stdout.getvalue()
@@ -587,7 +636,9 @@ class TestMakeTriggersCommand:
         assert "path/to/migration.py" in output
 
         # Test non-verbose output
-        command.stdout = StringIO()  # Reset output
+        # Reset output
+        command.stdout.seek(0)
+        command.stdout.truncate()
         command.verbose = False
         command._log_existing_trigger("path/to/migration.py")
         output = command.stdout.getvalue()
@@ -610,10 +661,8 @@ class TestMakeTriggersCommand:
         assert "Generating trigger SQL for model 'test_model'" in output
         assert "postgresql" in output
 
-    def test_process_app_models(self, command, monkeypatch):
+    def test_process_app_models(self, command, monkeypatch, example_app_config):
         """Test processing of app models."""
-        from django_tenant_options.management.commands.maketriggers import Command
-
         processed_models = []
 
         def mock_should_process_model(cls, model):
@@ -624,11 +673,10 @@ class TestMakeTriggersCommand:
             """Mock method to append processed models."""
             processed_models.append(model)
 
-        monkeypatch.setattr(Command, "_should_process_model", classmethod(mock_should_process_model))
-        monkeypatch.setattr(Command, "_process_model", mock_process_model)
+        monkeypatch.setattr(MakeTriggersCommand, "_should_process_model", classmethod(mock_should_process_model))
+        monkeypatch.setattr(MakeTriggersCommand, "_process_model", mock_process_model)
 
-        app_config = apps.get_app_config("example")
-        command._process_app_models(app_config)
+        command._process_app_models(example_app_config)
 
         # Verify _process_model was called for models in the app
         assert len(processed_models) > 0
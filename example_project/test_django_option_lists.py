@@ -23,6 +23,12 @@ def test_tenant(db):
     )
 
 
+@pytest.fixture(scope="module")
+def choice_field():
+    """An OptionsModelMultipleChoiceField shared by the label tests, which do not evaluate its queryset."""
+    return OptionsModelMultipleChoiceField(queryset=TaskPriorityOption.objects.all())
+
+
 def test_succeeds() -> None:
     """It exits with a status code of zero."""
     assert 0 == 0
@@ -53,7 +59,7 @@ class TestOptionsModelMultipleChoiceField:
             (OptionType.CUSTOM, "Test Option", "Test Option (custom)"),
         ],
     )
-    def test_label_from_instance(self, option_type, name, expected_label, test_tenant, db):
+    def test_label_from_instance(self, option_type, name, expected_label, choice_field, test_tenant, db):
         """Test that label_from_instance returns the correct label based on option_type."""
         # Create an option instance with tenant for CUSTOM type
         option_data = {
@@ -67,19 +73,22 @@ class TestOptionsModelMultipleChoiceField:
 
         option = TaskPriorityOption.objects.create(**option_data)
 
-        # Create the field instance
-        field = OptionsModelMultipleChoiceField(queryset=TaskPriorityOption.objects.all())
-
         # Test the label generation
-        assert field.label_from_instance(option) == expected_label
+        assert choice_field.label_from_instance(option) == expected_label
+
+
+@pytest.fixture(scope="module")
+def selection_subclasses():
+    """The concrete AbstractSelection subclasses, collected once for the module."""
+    return tuple(all_selection_subclasses())
 
 
 class TestHelpers:
     """Tests for helper functions."""
 
-    def test_all_selection_subclasses(self, db):
+    def test_all_selection_subclasses(self, selection_subclasses):
         """Test that all_selection_subclasses returns all non-abstract subclasses."""
-        subclasses = all_selection_subclasses()
+        subclasses = selection_subclasses
 
         # Verify that TaskPrioritySelection is in the list
         assert TaskPrioritySelection in subclasses
@@ -92,9 +101,9 @@ class TestHelpers:
             assert issubclass(cls, AbstractSelection)
             assert not cls._meta.abstract
 
-    def test_all_selection_subclasses_structure(self, db):
+    def test_all_selection_subclasses_structure(self, selection_subclasses):
         """Test the structure of classes returned by all_selection_subclasses."""
-        subclasses = all_selection_subclasses()
+        subclasses = selection_subclasses
 
         for cls in subclasses:
             # Verify each subclass has required attributes
@@ -1,10 +1,10 @@
 """Test cases for forms in the example project."""
 
-import random
-
 import pytest
 from django import forms
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.test import RequestFactory
 
 from django_tenant_options.choices import OptionType
 from django_tenant_options.exceptions import NoTenantProvidedFromViewError
@@ -13,6 +13,7 @@ from django_tenant_options.forms import OptionUpdateFormMixin
 from django_tenant_options.forms import SelectionsForm
 from django_tenant_options.forms import TenantFormBaseMixin
 from django_tenant_options.forms import UserFacingFormMixin
+from example_project.example.forms import TaskForm
 from example_project.example.models import Task
 from example_project.example.models import TaskPriorityOption
 from example_project.example.models import TaskPrioritySelection
@@ -24,6 +25,49 @@ from example_project.example.models import Tenant
 User = get_user_model()
 
 
+@pytest.fixture
+def tenants(db):
+    """Create the two Tenants used by the tests in this module, in a single query.
+
+    The Tenants are created inside each test's transaction, so they are rolled back with it and never outlive a run.
+    """
+    return tuple(
+        Tenant.objects.bulk_create(
+            [
+                Tenant(name="Test Tenant", subdomain="test-tenant"),
+                Tenant(name="Other Tenant", subdomain="other-tenant"),
+            ]
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def password_hash():
+    """Hash the test User's password once for the module, since hashing it is costly."""
+    return make_password("testpass")
+
+
+@pytest.fixture
+def user(db, password_hash):
+    """Create the User that owns the Tasks in the user-facing form tests.
+
+    Like the Tenants, the User is created inside each test's transaction, using the pre-computed password hash.
+    """
+    return User.objects.create(username="form-test-user", password=password_hash)
+
+
+@pytest.fixture
+def tenant(tenants):
+    """The shared Tenant that the form under test is bound to."""
+    return tenants[0]
+
+
+@pytest.fixture
+def other_tenant(tenants):
+    """A second shared Tenant, for tests checking that forms do not accept another Tenant's data."""
+    return tenants[1]
+
+
 @pytest.mark.django_db
 class TestTenantFormBaseMixin:
     """Test cases for TenantFormBaseMixin."""
@@ -39,194 +83,133 @@ class TestTenantFormBaseMixin:
             model = TaskPriorityOption
             fields = ["name", "option_type", "tenant"]
 
+    class FormWithAssociatedTenants(TenantFormBaseMixin, forms.ModelForm):
+        """Form with associated_tenants field for testing removal."""
+
+        associated_tenants = forms.ModelMultipleChoiceField(queryset=Tenant.objects.all())
+
+        class Meta:
+            """Meta class for form."""
+
+            model = TaskPriorityOption
+            fields = ["name", "tenant", "associated_tenants"]
+
+    class FormWithRequiredField(TenantFormBaseMixin, forms.ModelForm):
+        """Form with required field for testing clean method."""
+
+        required_field = forms.CharField(required=True)
+
+        class Meta:
+            """Meta class for form."""
+
+            model = TaskPriorityOption
+            fields = ["name", "tenant", "required_field"]
+
+    class ParentForm:
+        """Parent form class."""
+
+        def clean(self):
+            """Clean method that modifies data."""
+            data = super().clean()
+            data["extra"] = "parent_value"
+            return data
+
+    class ChildForm(ParentForm, TenantFormBaseMixin, forms.ModelForm):
+        """Child form with multiple inheritance."""
+
+        class Meta:
+            """Meta class for form."""
+
+            model = TaskPriorityOption
+            fields = ["name", "tenant", "option_type"]  # Added option_type
+
+        def clean(self):
+            """Clean method that modifies parent data."""
+            data = super().clean()
+            data["child"] = "child_value"
+            return data
+
+    class FormWithEmptyTenant(TenantFormBaseMixin, forms.ModelForm):
+        """Test form that simulates missing tenant in cleaned_data."""
+
+        class Meta:
+            """Meta class for form."""
+
+            model = TaskPriorityOption
+            fields = ["name", "tenant", "option_type"]  # Added option_type
+
+        def clean_tenant(self):
+            """Override clean_tenant to simulate tenant field being empty."""
+            return None
+
     def test_no_tenant_provided(self):
         """Test form raises error when no tenant provided."""
         with pytest.raises(NoTenantProvidedFromViewError):
             self.TestForm()
 
-    def test_tenant_field_hidden(self):
+    def test_tenant_field_hidden(self, tenant):
         """Test tenant field is hidden in form."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         form = self.TestForm(tenant=tenant)
         assert isinstance(form.fields["tenant"].widget, forms.HiddenInput)
         assert form.fields["tenant"].initial == tenant
 
-    def test_clean_tenant(self):
-        """Test clean method enforces correct tenant."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        other_tenant = Tenant.objects.create(name="Other Tenant", subdomain="other-tenant")
-
+    def test_clean_tenant(self, tenant, other_tenant):
+        """Test clean method enforces the form's tenant when a different tenant is submitted."""
         form = self.TestForm(
             tenant=tenant, data={"name": "Test Option", "tenant": other_tenant.id, "option_type": OptionType.CUSTOM}
         )
 
         assert form.is_valid()
         assert form.cleaned_data["tenant"] == tenant  # Should enforce original tenant
+        assert form.clean()["tenant"] == tenant
+        assert form.instance.tenant == tenant
 
-    def test_associated_tenants_field_removal(self):
+    def test_associated_tenants_field_removal(self, tenant):
         """Test associated_tenants field is removed from form."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class FormWithAssociatedTenants(TenantFormBaseMixin, forms.ModelForm):
-            """Form with associated_tenants field for testing removal."""
-
-            associated_tenants = forms.ModelMultipleChoiceField(queryset=Tenant.objects.all())
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "tenant", "associated_tenants"]
-
-        form = FormWithAssociatedTenants(tenant=tenant)
+        form = self.FormWithAssociatedTenants(tenant=tenant)
         assert "associated_tenants" not in form.fields
 
-    def test_clean_with_invalid_data(self):
+    def test_clean_with_invalid_data(self, tenant):
         """Test clean method with invalid form data."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class FormWithRequiredField(TenantFormBaseMixin, forms.ModelForm):
-            """Form with required field for testing clean method."""
-
-            required_field = forms.CharField(required=True)
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "tenant", "required_field"]
-
-        form = FormWithRequiredField(tenant=tenant, data={})
+        form = self.FormWithRequiredField(tenant=tenant, data={})
         assert not form.is_valid()
         assert "required_field" in form.errors
         assert "tenant" not in form.errors  # Tenant should still be valid
 
-    def test_clean_with_multiple_inheritance(self):
+    def test_clean_with_multiple_inheritance(self, tenant):
         """Test clean method behaves correctly with multiple inheritance."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class ParentForm:
-            """Parent form class."""
-
-            def clean(self):
-                """Clean method that modifies data."""
-                data = super().clean()
-                data["extra"] = "parent_value"
-                return data
-
-        class ChildForm(ParentForm, TenantFormBaseMixin, forms.ModelForm):
-            """Child form with multiple inheritance."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "tenant", "option_type"]  # Added option_type
-
-            def clean(self):
-                """Clean method that modifies parent data."""
-                data = super().clean()
-                data["child"] = "child_value"
-                return data
-
-        form = ChildForm(tenant=tenant, data={"name": "Test Option", "option_type": OptionType.CUSTOM})  # Added this
+        form = self.ChildForm(
+            tenant=tenant, data={"name": "Test Option", "option_type": OptionType.CUSTOM}  # Added this
+        )
         assert form.is_valid()
 
-    def test_clean_with_empty_tenant_data(self):
+    def test_clean_with_empty_tenant_data(self, tenant):
         """Test clean method when tenant is not in cleaned_data."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that simulates missing tenant in cleaned_data."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "tenant", "option_type"]  # Added option_type
-
-            def clean_tenant(self):
-                """Override clean_tenant to simulate tenant field being empty."""
-                return None
-
-        form = TestForm(
+        form = self.FormWithEmptyTenant(
             tenant=tenant,
             data={"name": "Test Option", "tenant": tenant.id, "option_type": OptionType.CUSTOM},  # Added this
         )
         assert form.is_valid()
 
-    def test_clean_with_different_tenant(self):
-        """Test clean method when submitted tenant differs from form tenant."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        other_tenant = Tenant.objects.create(name="Other Tenant", subdomain="other-tenant")
-
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that simulates different tenant in cleaned_data."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "tenant", "option_type"]  # Added option_type
-
-        form = TestForm(
-            tenant=tenant,
-            data={"name": "Test Option", "tenant": other_tenant.id, "option_type": OptionType.CUSTOM},  # Added this
-        )
-        assert form.is_valid()
-
-    def test_tenant_field_with_empty_value(self):
+    def test_tenant_field_with_empty_value(self, tenant):
         """Test form behavior when tenant field has empty value."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that includes tenant field."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "tenant", "option_type"]  # Added option_type
-
-        form = TestForm(
+        form = self.TestForm(
             tenant=tenant,
             data={"name": "Test Option", "tenant": "", "option_type": OptionType.CUSTOM},  # Empty value  # Added this
         )
         assert form.is_valid()
 
-    def test_tenant_field_enforcement_in_init(self):
+    def test_tenant_field_enforcement_in_init(self, tenant):
         """Test that tenant is properly set during form initialization."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that enforces tenant during initialization."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "tenant"]
-
-        form = TestForm(tenant=tenant)
+        form = self.TestForm(tenant=tenant)
 
         # Check that tenant field is properly configured
         assert isinstance(form.fields["tenant"].widget, forms.HiddenInput)
         assert form.fields["tenant"].initial == tenant
 
-    def test_tenant_field_with_data(self):
+    def test_tenant_field_with_data(self, tenant):
         """Test form behavior when tenant field is included."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that includes tenant field."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "tenant", "option_type"]
-
-        form = TestForm(
+        form = self.TestForm(
             tenant=tenant,
             data={
                 "name": "Test Option",
@@ -236,57 +219,17 @@ class TestTenantFormBaseMixin:
         )
 
         assert form.is_valid()
-        instance = form.save()
-        assert instance.tenant == tenant
-
-    def test_tenant_field_set_by_mixin(self):
-        """Test that tenant is enforced by mixin."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        other_tenant = Tenant.objects.create(name="Other Tenant", subdomain="other-tenant")
-
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that includes tenant field."""
-
-            class Meta:
-                """Meta class for form."""
+        assert form.instance.tenant == tenant
 
-                model = TaskPriorityOption
-                fields = ["name", "tenant", "option_type"]
-
-        form = TestForm(
-            tenant=tenant,
-            data={
-                "name": "Test Option",
-                "option_type": OptionType.CUSTOM,
-                "tenant": other_tenant.id,  # Try to use different tenant
-            },
-        )
-
-        assert form.is_valid()
-        instance = form.save()
-        assert instance.tenant == tenant  # Should be original tenant
-        assert instance.tenant != other_tenant
-
-    def test_tenant_field_handling(self):
+    def test_tenant_field_handling(self, tenant):
         """Test tenant field initialization and handling."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that includes tenant field."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "option_type", "tenant"]
-
-        form = TestForm(tenant=tenant)
+        form = self.TestForm(tenant=tenant)
         # Check initial field setup
         assert isinstance(form.fields["tenant"].widget, forms.HiddenInput)
         assert form.fields["tenant"].initial == tenant
 
         # Test form submission with Custom type (requires tenant)
-        form = TestForm(
+        form = self.TestForm(
             tenant=tenant,
             data={
                 "name": "Test Option",
@@ -296,31 +239,19 @@ class TestTenantFormBaseMixin:
         )
 
         assert form.is_valid()
-        instance = form.save()
-        assert instance.tenant == tenant
+        assert form.instance.tenant == tenant
 
-    def test_instance_initialization(self):
+    def test_instance_initialization(self, tenant):
         """Test form initialization with an existing instance."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
         option = TaskPriorityOption.objects.create(name="Test Option", option_type=OptionType.CUSTOM, tenant=tenant)
 
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that includes tenant field."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "option_type", "tenant"]
-
         # Test initialization without data
-        form = TestForm(tenant=tenant, instance=option)
+        form = self.TestForm(tenant=tenant, instance=option)
         assert isinstance(form.fields["tenant"].widget, forms.HiddenInput)
         assert form.fields["tenant"].initial == tenant
 
         # Test updating the instance
-        form = TestForm(
+        form = self.TestForm(
             tenant=tenant,
             instance=option,
             data={
@@ -335,61 +266,6 @@ class TestTenantFormBaseMixin:
         assert updated.tenant == tenant
         assert updated.name == "Updated Option"
 
-    def test_different_tenant_handling(self):
-        """Test that form enforces original tenant even if different tenant provided."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        other_tenant = Tenant.objects.create(name="Other Tenant", subdomain="other-tenant")
-
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that includes tenant field."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "option_type", "tenant"]
-
-        form = TestForm(
-            tenant=tenant,
-            data={
-                "name": "Test Option",
-                "option_type": OptionType.CUSTOM,
-                "tenant": other_tenant.id,  # Try to use different tenant
-            },
-        )
-
-        assert form.is_valid()
-        instance = form.save()
-        assert instance.tenant == tenant
-        assert instance.tenant != other_tenant
-
-    def test_tenant_field_clean_method(self):
-        """Test that the clean method always enforces the tenant."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        other_tenant = Tenant.objects.create(name="Other Tenant", subdomain="other-tenant")
-
-        class TestForm(TenantFormBaseMixin, forms.ModelForm):
-            """Test form that includes tenant field."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = ["name", "option_type", "tenant"]
-
-        # Test with a custom option (requires tenant)
-        form = TestForm(
-            tenant=tenant,
-            data={
-                "name": "Test Custom Option",
-                "option_type": OptionType.CUSTOM,
-                "tenant": other_tenant.id,  # Try to use a different tenant
-            },
-        )
-        assert form.is_valid()
-        cleaned_data = form.clean()
-        assert cleaned_data["tenant"] == tenant  # Should enforce original tenant
-
 
 @pytest.mark.django_db
 class TestOptionCreateFormMixin:
@@ -406,25 +282,39 @@ class TestOptionCreateFormMixin:
             model = TaskPriorityOption
             fields = "__all__"
 
-    def test_option_type_hidden_and_custom(self):
+    class CustomMixin:
+        """Custom mixin for form."""
+
+        def clean_name(self, *args, **kwargs):
+            """Custom clean method for name field."""
+            name = self.cleaned_data.get("name", "")
+            return name.upper()
+
+    class ComplexCreateForm(CustomMixin, OptionCreateFormMixin, forms.ModelForm):
+        """Complex form for testing multiple inheritance."""
+
+        class Meta:
+            """Meta class for form."""
+
+            model = TaskPriorityOption
+            fields = "__all__"
+
+    def test_option_type_hidden_and_custom(self, tenant):
         """Test option_type is hidden and set to CUSTOM."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         form = self.TestCreateForm(tenant=tenant)
 
         assert isinstance(form.fields["option_type"].widget, forms.HiddenInput)
         assert form.fields["option_type"].initial == OptionType.CUSTOM
 
-    def test_deleted_field_hidden_and_none(self):
+    def test_deleted_field_hidden_and_none(self, tenant):
         """Test deleted field is hidden and set to None."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         form = self.TestCreateForm(tenant=tenant)
 
         assert isinstance(form.fields["deleted"].widget, forms.HiddenInput)
         assert form.fields["deleted"].initial is None
 
-    def test_create_option(self):
+    def test_create_option(self, tenant):
         """Test creating a custom option."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         form = self.TestCreateForm(
             tenant=tenant,
             data={"name": "Custom Option", "option_type": OptionType.CUSTOM, "tenant": tenant.id, "deleted": None},
@@ -437,39 +327,18 @@ class TestOptionCreateFormMixin:
         assert option.tenant == tenant
         assert option.deleted is None
 
-    def test_inheritance_chain(self):
+    def test_inheritance_chain(self, tenant):
         """Test form works with multiple inheritance."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class CustomMixin:
-            """Custom mixin for form."""
-
-            def clean_name(self, *args, **kwargs):
-                """Custom clean method for name field."""
-                name = self.cleaned_data.get("name", "")
-                return name.upper()
-
-        class ComplexCreateForm(CustomMixin, OptionCreateFormMixin, forms.ModelForm):
-            """Complex form for testing multiple inheritance."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = "__all__"
-
-        form = ComplexCreateForm(
+        form = self.ComplexCreateForm(
             tenant=tenant,
             data={"name": "test option", "option_type": OptionType.CUSTOM, "tenant": tenant.id, "deleted": None},
         )
 
         assert form.is_valid()
-        option = form.save()
-        assert option.name == "TEST OPTION"  # Verify CustomMixin.clean_name was called
+        assert form.instance.name == "TEST OPTION"  # Verify CustomMixin.clean_name was called
 
-    def test_attempt_non_custom_option_type(self):
+    def test_attempt_non_custom_option_type(self, tenant):
         """Test attempt to create option with non-custom option type."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         form = self.TestCreateForm(
             tenant=tenant,
             data={
@@ -481,8 +350,7 @@ class TestOptionCreateFormMixin:
         )
 
         assert form.is_valid()
-        option = form.save()
-        assert option.option_type == OptionType.CUSTOM  # Should force CUSTOM type
+        assert form.instance.option_type == OptionType.CUSTOM  # Should force CUSTOM type
 
 
 @pytest.mark.django_db
@@ -500,17 +368,32 @@ class TestOptionUpdateFormMixin:
             model = TaskPriorityOption
             fields = "__all__"
 
-    def test_delete_field_added(self):
+    class UpdateFormWithoutDelete(OptionUpdateFormMixin, forms.ModelForm):
+        """Form for testing clean method without delete field."""
+
+        class Meta:
+            """Meta class for form."""
+
+            model = TaskPriorityOption
+            fields = "__all__"
+
+        def clean(self):
+            """Clean method that removes the delete key."""
+            cleaned_data = super().clean()
+            # Simulate cleaned_data without delete key
+            if "delete" in cleaned_data:
+                del cleaned_data["delete"]
+            return cleaned_data
+
+    def test_delete_field_added(self, tenant):
         """Test delete checkbox field is added."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         form = self.TestUpdateForm(tenant=tenant)
         assert "delete" in form.fields
         assert isinstance(form.fields["delete"], forms.BooleanField)
         assert form.fields["delete"].required is False
 
-    def test_update_without_delete(self):
+    def test_update_without_delete(self, tenant):
         """Test updating option without deletion."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         option = TaskPriorityOption.objects.create(name="Original Name", option_type=OptionType.CUSTOM, tenant=tenant)
 
         form = self.TestUpdateForm(
@@ -530,9 +413,8 @@ class TestOptionUpdateFormMixin:
         assert updated_option.name == "Updated Name"
         assert updated_option.deleted is None
 
-    def test_update_with_delete(self):
+    def test_update_with_delete(self, tenant):
         """Test updating option with deletion."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         option = TaskPriorityOption.objects.create(name="To Delete", option_type=OptionType.CUSTOM, tenant=tenant)
 
         form = self.TestUpdateForm(
@@ -551,9 +433,8 @@ class TestOptionUpdateFormMixin:
         updated_option = form.save()
         assert updated_option.deleted is not None
 
-    def test_partial_update(self):
+    def test_partial_update(self, tenant):
         """Test partial update of option fields."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         option = TaskPriorityOption.objects.create(name="Original Name", option_type=OptionType.CUSTOM, tenant=tenant)
 
         # Only update name field
@@ -573,10 +454,8 @@ class TestOptionUpdateFormMixin:
         assert updated_option.option_type == OptionType.CUSTOM
         assert updated_option.tenant == tenant
 
-    def test_attempted_tenant_change(self):
+    def test_attempted_tenant_change(self, tenant, other_tenant):
         """Test attempt to change option's tenant."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        other_tenant = Tenant.objects.create(name="Other Tenant", subdomain="other-tenant")
         option = TaskPriorityOption.objects.create(name="Test Option", option_type=OptionType.CUSTOM, tenant=tenant)
 
         form = self.TestUpdateForm(
@@ -595,9 +474,8 @@ class TestOptionUpdateFormMixin:
         updated_option = form.save()
         assert updated_option.tenant == tenant  # Tenant should not change
 
-    def test_update_custom_option_type_preservation(self):
+    def test_update_custom_option_type_preservation(self, tenant):
         """Test that updating a custom option preserves its option type."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         option = TaskPriorityOption.objects.create(name="Original Name", option_type=OptionType.CUSTOM, tenant=tenant)
 
         form = self.TestUpdateForm(
@@ -617,12 +495,13 @@ class TestOptionUpdateFormMixin:
         assert updated_option.name == "Updated Name"
         assert updated_option.option_type == OptionType.CUSTOM  # Should preserve CUSTOM type
 
-    def test_update_invalid_name(self):
+    def test_update_invalid_name(self, tenant):
         """Test updating an option with an invalid name."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        TaskPriorityOption.objects.create(name="Existing Name", option_type=OptionType.MANDATORY)
-        custom_option = TaskPriorityOption.objects.create(
-            name="Original Name", option_type=OptionType.CUSTOM, tenant=tenant
+        _, custom_option = TaskPriorityOption.objects.bulk_create(
+            [
+                TaskPriorityOption(name="Existing Name", option_type=OptionType.MANDATORY),
+                TaskPriorityOption(name="Original Name", option_type=OptionType.CUSTOM, tenant=tenant),
+            ]
         )
 
         form = self.TestUpdateForm(
@@ -641,27 +520,9 @@ class TestOptionUpdateFormMixin:
         # Update this assertion to match the actual error message
         assert any("Existing Name" in error for error in form.errors.get("__all__", []))
 
-    def test_clean_without_delete_field(self):
+    def test_clean_without_delete_field(self, tenant):
         """Test clean method behavior when delete field is missing from cleaned_data."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class UpdateForm(OptionUpdateFormMixin, forms.ModelForm):
-            """Form for testing clean method without delete field."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = TaskPriorityOption
-                fields = "__all__"
-
-            def clean(self):
-                cleaned_data = super().clean()
-                # Simulate cleaned_data without delete key
-                if "delete" in cleaned_data:
-                    del cleaned_data["delete"]
-                return cleaned_data
-
-        form = UpdateForm(tenant=tenant, data={"name": "Test Option"})
+        form = self.UpdateFormWithoutDelete(tenant=tenant, data={"name": "Test Option"})
         assert form.is_valid()
         assert form.cleaned_data.get("deleted") is None
 
@@ -680,38 +541,39 @@ class TestForSelectionsForm:
 
             model = TaskPrioritySelection
 
-    def test_form_initialization(self):
+    @pytest.fixture
+    def priority_options(self, tenant):
+        """Create a mandatory, an optional, and a custom TaskPriorityOption in a single query."""
+        mandatory, optional, custom = TaskPriorityOption.objects.bulk_create(
+            [
+                TaskPriorityOption(name="Mandatory", option_type=OptionType.MANDATORY),
+                TaskPriorityOption(name="Optional", option_type=OptionType.OPTIONAL),
+                TaskPriorityOption(name="Custom", option_type=OptionType.CUSTOM, tenant=tenant),
+            ]
+        )
+        return {"mandatory": mandatory, "optional": optional, "custom": custom}
+
+    def test_form_initialization(self, tenant):
         """Test selections form initialization."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         form = self.TestSelectionsForm(tenant=tenant)
 
         assert "selections" in form.fields
         assert hasattr(form, "selection_model")
         assert hasattr(form, "option_model")
 
-    def test_selections_queryset(self):
+    def test_selections_queryset(self, tenant, priority_options):
         """Test selections queryset is properly filtered."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        # Create options of different types
-        mandatory = TaskPriorityOption.objects.create(name="Mandatory", option_type=OptionType.MANDATORY)
-        optional = TaskPriorityOption.objects.create(name="Optional", option_type=OptionType.OPTIONAL)
-        custom = TaskPriorityOption.objects.create(name="Custom", option_type=OptionType.CUSTOM, tenant=tenant)
-
         form = self.TestSelectionsForm(tenant=tenant)
         queryset = form.fields["selections"].queryset
 
-        assert mandatory in queryset
-        assert optional in queryset
-        assert custom in queryset
+        assert priority_options["mandatory"] in queryset
+        assert priority_options["optional"] in queryset
+        assert priority_options["custom"] in queryset
 
-    def test_save_selections(self):
+    def test_save_selections(self, tenant, priority_options):
         """Test saving selections."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        # Create options
-        mandatory = TaskPriorityOption.objects.create(name="Mandatory", option_type=OptionType.MANDATORY)
-        optional = TaskPriorityOption.objects.create(name="Optional", option_type=OptionType.OPTIONAL)
+        mandatory = priority_options["mandatory"]
+        optional = priority_options["optional"]
 
         form = self.TestSelectionsForm(tenant=tenant, data={"selections": [optional.id]})  # Select optional option
 
@@ -723,12 +585,10 @@ class TestForSelectionsForm:
         assert mandatory in selected_options  # Mandatory should always be included
         assert optional in selected_options  # Optional should be included because we selected it
 
-    def test_mandatory_options_always_selected(self):
+    def test_mandatory_options_always_selected(self, tenant, priority_options):
         """Test that mandatory options are always included in selections."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        mandatory = TaskPriorityOption.objects.create(name="Mandatory", option_type=OptionType.MANDATORY)
-        optional = TaskPriorityOption.objects.create(name="Optional", option_type=OptionType.OPTIONAL)
+        mandatory = priority_options["mandatory"]
+        optional = priority_options["optional"]
 
         # Try to submit form without selecting mandatory option
         form = self.TestSelectionsForm(tenant=tenant, data={"selections": [optional.id]})
@@ -740,12 +600,9 @@ class TestForSelectionsForm:
         selections = TaskPrioritySelection.objects.filter(tenant=tenant, option=mandatory)
         assert selections.exists()
 
-    def test_remove_existing_selection(self):
+    def test_remove_existing_selection(self, tenant, priority_options):
         """Test removing an existing selection."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        optional = TaskPriorityOption.objects.create(name="Optional", option_type=OptionType.OPTIONAL)
-        selection = TaskPrioritySelection.objects.create(tenant=tenant, option=optional)
+        selection = TaskPrioritySelection.objects.create(tenant=tenant, option=priority_options["optional"])
         selection_id = selection.id
 
         # Submit form without the optional selection
@@ -757,12 +614,14 @@ class TestForSelectionsForm:
         # Verify selection was removed
         assert not TaskPrioritySelection.objects.filter(id=selection_id, deleted__isnull=True).exists()
 
-    def test_concurrent_selection_updates(self):
+    def test_concurrent_selection_updates(self, tenant):
         """Test handling of concurrent selection updates."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        optional1 = TaskPriorityOption.objects.create(name="Optional 1", option_type=OptionType.OPTIONAL)
-        optional2 = TaskPriorityOption.objects.create(name="Optional 2", option_type=OptionType.OPTIONAL)
+        optional1, optional2 = TaskPriorityOption.objects.bulk_create(
+            [
+                TaskPriorityOption(name="Optional 1", option_type=OptionType.OPTIONAL),
+                TaskPriorityOption(name="Optional 2", option_type=OptionType.OPTIONAL),
+            ]
+        )
 
         # Create two forms simultaneously
         form1 = self.TestSelectionsForm(tenant=tenant, data={"selections": [optional1.id]})
@@ -773,28 +632,28 @@ class TestForSelectionsForm:
         form2.save()
 
         # Verify final state includes both selections
-        selections = TaskPrioritySelection.objects.filter(tenant=tenant)
-        selected_options = [s.option.id for s in selections]
-        assert optional2.id in selected_options  # Last save wins
+        assert TaskPrioritySelection.objects.filter(tenant=tenant, option=optional2).exists()  # Last save wins
 
-    def test_selections_with_deleted_mandatory_option(self):
+    def test_selections_with_deleted_mandatory_option(self, tenant, priority_options):
         """Test handling of selections when a mandatory option is deleted."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        mandatory = TaskPriorityOption.objects.create(name="Mandatory", option_type=OptionType.MANDATORY)
+        mandatory = priority_options["mandatory"]
         TaskPrioritySelection.objects.create(tenant=tenant, option=mandatory)
 
         # Soft delete the mandatory option
-        mandatory.delete()
+        TaskPriorityOption.objects.filter(pk=mandatory.pk).delete()
 
         form = self.TestSelectionsForm(tenant=tenant)
         assert mandatory not in form.fields["selections"].queryset
 
-    def test_concurrent_selections_with_mandatory(self):
+    def test_concurrent_selections_with_mandatory(self, tenant):
         """Test handling concurrent selections with mandatory options."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        mandatory = TaskPriorityOption.objects.create(name="Mandatory", option_type=OptionType.MANDATORY)
-        optional1 = TaskPriorityOption.objects.create(name="Optional 1", option_type=OptionType.OPTIONAL)
-        optional2 = TaskPriorityOption.objects.create(name="Optional 2", option_type=OptionType.OPTIONAL)
+        mandatory, optional1, optional2 = TaskPriorityOption.objects.bulk_create(
+            [
+                TaskPriorityOption(name="Mandatory", option_type=OptionType.MANDATORY),
+                TaskPriorityOption(name="Optional 1", option_type=OptionType.OPTIONAL),
+                TaskPriorityOption(name="Optional 2", option_type=OptionType.OPTIONAL),
+            ]
+        )
 
         # Create two forms with different selections but both excluding mandatory
         form1 = self.TestSelectionsForm(tenant=tenant, data={"selections": [optional1.id]})
@@ -805,19 +664,17 @@ class TestForSelectionsForm:
         form2.save()
 
         # Verify final state includes mandatory option and last selected optional
-        selections = TaskPrioritySelection.objects.filter(tenant=tenant, deleted__isnull=True)
-        selected_options = [s.option.id for s in selections]
+        selected_options = TaskPrioritySelection.objects.filter(tenant=tenant, deleted__isnull=True).values_list(
+            "option_id", flat=True
+        )
         assert mandatory.id in selected_options
         assert optional2.id in selected_options
         assert optional1.id not in selected_options
 
-    def test_mandatory_selection_validation(self):
+    def test_mandatory_selection_validation(self, tenant, priority_options):
         """Test that mandatory options cannot be deselected."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        # Create mandatory and optional options
-        mandatory = TaskPriorityOption.objects.create(name="Mandatory", option_type=OptionType.MANDATORY)
-        optional = TaskPriorityOption.objects.create(name="Optional", option_type=OptionType.OPTIONAL)
+        mandatory = priority_options["mandatory"]
+        optional = priority_options["optional"]
 
         # Try to submit form without mandatory option
         form = self.TestSelectionsForm(tenant=tenant, data={"selections": [optional.id]})  # Only select optional
@@ -833,33 +690,35 @@ class TestForSelectionsForm:
         assert mandatory.id in selections
         assert optional.id in selections
 
-    def test_selections_form_empty_selection(self):
+    def test_selections_form_empty_selection(self, tenant, django_assert_num_queries):
         """Test form behavior with empty selection list."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
         # Create mandatory option
         mandatory = TaskPriorityOption.objects.create(name="Mandatory", option_type=OptionType.MANDATORY)
 
         # Submit form with empty selections
-        form = self.TestSelectionsForm(tenant=tenant, data={"selections": []})
+        with django_assert_num_queries(0):
+            form = self.TestSelectionsForm(tenant=tenant, data={"selections": []})
 
         # Form should be valid (mandatory will be added)
         assert form.is_valid()
-        form.save()
+        with django_assert_num_queries(12):
+            form.save()
 
         # Verify only mandatory remains
         selections = TaskPrioritySelection.objects.filter(tenant=tenant, deleted__isnull=True)
-        assert selections.count() == 1
-        assert selections.first().option == mandatory
+        option_ids = list(selections.values_list("option_id", flat=True))
+        assert option_ids == [mandatory.id]
 
-    def test_multiple_mandatory_options(self):
+    def test_multiple_mandatory_options(self, tenant):
         """Test form behavior with multiple mandatory options."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
         # Create multiple mandatory options
-        mandatory1 = TaskPriorityOption.objects.create(name="Mandatory 1", option_type=OptionType.MANDATORY)
-        mandatory2 = TaskPriorityOption.objects.create(name="Mandatory 2", option_type=OptionType.MANDATORY)
-        optional = TaskPriorityOption.objects.create(name="Optional", option_type=OptionType.OPTIONAL)
+        mandatory1, mandatory2, optional = TaskPriorityOption.objects.bulk_create(
+            [
+                TaskPriorityOption(name="Mandatory 1", option_type=OptionType.MANDATORY),
+                TaskPriorityOption(name="Mandatory 2", option_type=OptionType.MANDATORY),
+                TaskPriorityOption(name="Optional", option_type=OptionType.OPTIONAL),
+            ]
+        )
 
         # Submit form selecting only optional
         form = self.TestSelectionsForm(tenant=tenant, data={"selections": [optional.id]})
@@ -891,10 +750,32 @@ class TestUserFacingFormMixin:
             model = Task
             fields = ["title", "description", "priority", "status", "user"]
 
+    class FormWithNonOptionFK(UserFacingFormMixin, forms.ModelForm):
+        """Test form with a non-option foreign key field."""
+
+        non_option_field = forms.ModelChoiceField(queryset=User.objects.all(), required=False)
+
+        class Meta:
+            """Meta class for form."""
+
+            model = Task
+            fields = ["title", "description", "priority", "non_option_field"]
+
+    class FormWithUnsetQueryset(UserFacingFormMixin, forms.ModelForm):
+        """Test form with foreign key field with None queryset."""
+
+        empty_field = forms.ModelChoiceField(queryset=None)
+
+        class Meta:
+            """Meta class for form."""
+
+            model = Task
+            fields = ["title", "description", "priority", "status", "user"]
+
     @pytest.fixture(autouse=True)
-    def setup_test_environment(self):
+    def setup_test_environment(self, user):
         """Set up test environment with required user."""
-        self.user = User.objects.create_user(username=f"testuser{random.randrange(9999999)}", password="testpass")
+        self.user = user
         yield
 
     def test_no_tenant_provided(self):
@@ -902,34 +783,29 @@ class TestUserFacingFormMixin:
         with pytest.raises(NoTenantProvidedFromViewError):
             self.TestUserFacingForm()
 
-    def test_handle_deleted_selection(self):
+    def test_handle_deleted_selection(self, tenant):
         """Test handling of deleted selections."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         option = TaskPriorityOption.objects.create(name="To Delete", option_type=OptionType.CUSTOM, tenant=tenant)
         TaskPrioritySelection.objects.create(tenant=tenant, option=option)
 
         task = Task.objects.create(title="Test Task", description="Test Description", priority=option, user=self.user)
 
         # Soft delete the option
-        option.delete()
+        TaskPriorityOption.objects.filter(pk=option.pk).delete()
 
         form = self.TestUserFacingForm(tenant=tenant, instance=task)
         assert option not in form.fields["priority"].queryset
 
-    def test_tenant_field_hidden(self):
+    def test_tenant_field_hidden(self, tenant):
         """Test tenant field is hidden in form."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         form = self.TestUserFacingForm(tenant=tenant)
 
         if "tenant" in form.fields:  # Only test if the form has a tenant field
             assert isinstance(form.fields["tenant"].widget, forms.HiddenInput)
             assert form.fields["tenant"].initial == tenant
 
-    def test_clean_tenant(self):
+    def test_clean_tenant(self, tenant, other_tenant):
         """Test clean method enforces correct tenant."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        other_tenant = Tenant.objects.create(name="Other Tenant", subdomain="other-tenant")
-
         form = self.TestUserFacingForm(
             tenant=tenant,
             data={
@@ -942,22 +818,23 @@ class TestUserFacingFormMixin:
         form.is_valid()  # Run validation
         assert form.cleaned_data.get("tenant") == tenant  # Should enforce original tenant
 
-    def test_foreign_key_field_filtering(self):
+    def test_foreign_key_field_filtering(self, tenant, other_tenant):
         """Test filtering of foreign key fields."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        other_tenant = Tenant.objects.create(name="Other Tenant", subdomain="other-tenant")
-
         # Create options for different tenants
-        tenant_option = TaskPriorityOption.objects.create(
-            name="Tenant Option", option_type=OptionType.CUSTOM, tenant=tenant
-        )
-        other_option = TaskPriorityOption.objects.create(
-            name="Other Option", option_type=OptionType.CUSTOM, tenant=other_tenant
+        tenant_option, other_option = TaskPriorityOption.objects.bulk_create(
+            [
+                TaskPriorityOption(name="Tenant Option", option_type=OptionType.CUSTOM, tenant=tenant),
+                TaskPriorityOption(name="Other Option", option_type=OptionType.CUSTOM, tenant=other_tenant),
+            ]
         )
 
         # Create associated selection
-        TaskPrioritySelection.objects.create(tenant=tenant, option=tenant_option)
-        TaskPrioritySelection.objects.create(tenant=other_tenant, option=other_option)
+        TaskPrioritySelection.objects.bulk_create(
+            [
+                TaskPrioritySelection(tenant=tenant, option=tenant_option),
+                TaskPrioritySelection(tenant=other_tenant, option=other_option),
+            ]
+        )
 
         form = self.TestUserFacingForm(tenant=tenant)
         priority_queryset = form.fields["priority"].queryset
@@ -965,10 +842,8 @@ class TestUserFacingFormMixin:
         assert tenant_option in priority_queryset
         assert other_option not in priority_queryset
 
-    def test_multiple_foreign_key_fields(self):
+    def test_multiple_foreign_key_fields(self, tenant, django_assert_num_queries):
         """Test handling of multiple foreign key fields to option models."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
         # Create options for tenant
         priority = TaskPriorityOption.objects.create(name="Priority", option_type=OptionType.CUSTOM, tenant=tenant)
         status = TaskStatusOption.objects.create(name="Status", option_type=OptionType.CUSTOM, tenant=tenant)
@@ -977,30 +852,29 @@ class TestUserFacingFormMixin:
         TaskPrioritySelection.objects.create(tenant=tenant, option=priority)
         TaskStatusSelection.objects.create(tenant=tenant, option=status)
 
-        form = self.TestUserFacingForm(tenant=tenant)
+        with django_assert_num_queries(0):
+            form = self.TestUserFacingForm(tenant=tenant)
 
         # Verify both foreign key fields are properly filtered
         assert priority in form.fields["priority"].queryset
         assert status in form.fields["status"].queryset
 
-    def test_field_initial_values(self):
+    def test_field_initial_values(self, tenant):
         """Test initial values for foreign key fields with existing instance."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         priority = TaskPriorityOption.objects.create(name="Priority", option_type=OptionType.CUSTOM, tenant=tenant)
         task = Task.objects.create(title="Test Task", description="Test Description", priority=priority, user=self.user)
 
         form = self.TestUserFacingForm(tenant=tenant, instance=task)
         assert form.fields["priority"].initial == priority.id
 
-    def test_disabled_field_for_deleted_selection_setting(self):
+    def test_disabled_field_for_deleted_selection_setting(self, tenant):
         """Test DISABLE_FIELD_FOR_DELETED_SELECTION setting behavior."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         option = TaskPriorityOption.objects.create(name="To Delete", option_type=OptionType.CUSTOM, tenant=tenant)
         TaskPrioritySelection.objects.create(tenant=tenant, option=option)
         task = Task.objects.create(title="Test Task", description="Test Description", priority=option, user=self.user)
 
         # Soft delete the option
-        option.delete()
+        TaskPriorityOption.objects.filter(pk=option.pk).delete()
 
         with pytest.MonkeyPatch.context() as mp:
             mp.setattr("django_tenant_options.forms.DISABLE_FIELD_FOR_DELETED_SELECTION", True)
@@ -1009,9 +883,8 @@ class TestUserFacingFormMixin:
             assert form.fields["priority"].widget.attrs.get("readonly") == "readonly"
             assert option in form.fields["priority"].queryset
 
-    def test_multiple_option_fields_one_deleted(self):
+    def test_multiple_option_fields_one_deleted(self, tenant):
         """Test form with multiple option fields where one selection is deleted."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         priority = TaskPriorityOption.objects.create(name="Priority", option_type=OptionType.CUSTOM, tenant=tenant)
         status = TaskStatusOption.objects.create(name="Status", option_type=OptionType.CUSTOM, tenant=tenant)
         TaskPrioritySelection.objects.create(tenant=tenant, option=priority)
@@ -1022,15 +895,14 @@ class TestUserFacingFormMixin:
         )
 
         # Soft delete one option
-        priority.delete()
+        TaskPriorityOption.objects.filter(pk=priority.pk).delete()
 
         form = self.TestUserFacingForm(tenant=tenant, instance=task)
         assert priority not in form.fields["priority"].queryset
         assert status in form.fields["status"].queryset
 
-    def test_foreign_key_field_initial_values_none(self):
+    def test_foreign_key_field_initial_values_none(self, tenant):
         """Test initial values for foreign key fields when values are None."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         task = Task.objects.create(
             title="Test Task", description="Test Description", priority=None, status=None, user=self.user
         )
@@ -1039,15 +911,14 @@ class TestUserFacingFormMixin:
         assert form.fields["priority"].initial is None
         assert form.fields["status"].initial is None
 
-    def test_clean_with_disabled_deleted_selection(self):
+    def test_clean_with_disabled_deleted_selection(self, tenant):
         """Test clean method behavior with disabled deleted selection."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         option = TaskPriorityOption.objects.create(name="To Delete", option_type=OptionType.CUSTOM, tenant=tenant)
         TaskPrioritySelection.objects.create(tenant=tenant, option=option)
         task = Task.objects.create(title="Test Task", description="Test Description", priority=option, user=self.user)
 
         # Soft delete the option
-        option.delete()
+        TaskPriorityOption.objects.filter(pk=option.pk).delete()
 
         with pytest.MonkeyPatch.context() as mp:
             mp.setattr("django_tenant_options.forms.DISABLE_FIELD_FOR_DELETED_SELECTION", True)
@@ -1064,9 +935,8 @@ class TestUserFacingFormMixin:
             assert form.is_valid()
             assert form.cleaned_data["priority"] == option
 
-    def test_multiple_option_fields_validation(self):
+    def test_multiple_option_fields_validation(self, tenant):
         """Test validation of multiple option fields simultaneously."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         priority = TaskPriorityOption.objects.create(name="Priority", option_type=OptionType.CUSTOM, tenant=tenant)
         status = TaskStatusOption.objects.create(name="Status", option_type=OptionType.CUSTOM, tenant=tenant)
 
@@ -1090,24 +960,22 @@ class TestUserFacingFormMixin:
         assert saved_task.priority == priority
         assert saved_task.status == status
 
-    def test_form_with_no_selected_options(self):
+    def test_form_with_no_selected_options(self, tenant):
         """Test form behavior when no options are selected for the tenant."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         priority = TaskPriorityOption.objects.create(name="Priority", option_type=OptionType.OPTIONAL)
 
         form = self.TestUserFacingForm(tenant=tenant)
         assert priority not in form.fields["priority"].queryset
 
-    def test_form_with_deleted_instance_option(self):
+    def test_form_with_deleted_instance_option(self, tenant):
         """Test form behavior when the instance has a deleted option."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         option = TaskPriorityOption.objects.create(name="Priority", option_type=OptionType.CUSTOM, tenant=tenant)
         TaskPrioritySelection.objects.create(tenant=tenant, option=option)
 
         task = Task.objects.create(title="Test Task", description="Test Description", priority=option, user=self.user)
 
         # Soft delete the option
-        option.delete()
+        TaskPriorityOption.objects.filter(pk=option.pk).delete()
 
         # Test with DISABLE_FIELD_FOR_DELETED_SELECTION = False
         with pytest.MonkeyPatch.context() as mp:
@@ -1117,21 +985,22 @@ class TestUserFacingFormMixin:
             assert "readonly" not in form.fields["priority"].widget.attrs
             assert "disabled" not in form.fields["priority"].widget.attrs
 
-    def test_form_update_with_tenant_conflict(self):
+    def test_form_update_with_tenant_conflict(self, tenant, other_tenant):
         """Test updating a form with an option from a different tenant."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-        other_tenant = Tenant.objects.create(name="Other Tenant", subdomain="other-tenant")
-
         # Create options for both tenants
-        tenant_option = TaskPriorityOption.objects.create(
-            name="Tenant Option", option_type=OptionType.CUSTOM, tenant=tenant
-        )
-        other_option = TaskPriorityOption.objects.create(
-            name="Other Option", option_type=OptionType.CUSTOM, tenant=other_tenant
+        tenant_option, other_option = TaskPriorityOption.objects.bulk_create(
+            [
+                TaskPriorityOption(name="Tenant Option", option_type=OptionType.CUSTOM, tenant=tenant),
+                TaskPriorityOption(name="Other Option", option_type=OptionType.CUSTOM, tenant=other_tenant),
+            ]
         )
 
-        TaskPrioritySelection.objects.create(tenant=tenant, option=tenant_option)
-        TaskPrioritySelection.objects.create(tenant=other_tenant, option=other_option)
+        TaskPrioritySelection.objects.bulk_create(
+            [
+                TaskPrioritySelection(tenant=tenant, option=tenant_option),
+                TaskPrioritySelection(tenant=other_tenant, option=other_option),
+            ]
+        )
 
         # Try to submit form with option from other tenant
         form = self.TestUserFacingForm(
@@ -1146,21 +1015,23 @@ class TestUserFacingFormMixin:
         assert not form.is_valid()
         assert "priority" in form.errors
 
-    def test_mixed_option_types(self):
+    def test_mixed_option_types(self, tenant, django_assert_num_queries):
         """Test form handling of mandatory, optional, and custom options."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
         # Create different types of options
-        mandatory = TaskPriorityOption.objects.create(name="Mandatory", option_type=OptionType.MANDATORY)
-        optional = TaskPriorityOption.objects.create(name="Optional", option_type=OptionType.OPTIONAL)
-        custom = TaskPriorityOption.objects.create(name="Custom", option_type=OptionType.CUSTOM, tenant=tenant)
+        options = TaskPriorityOption.objects.bulk_create(
+            [
+                TaskPriorityOption(name="Mandatory", option_type=OptionType.MANDATORY),
+                TaskPriorityOption(name="Optional", option_type=OptionType.OPTIONAL),
+                TaskPriorityOption(name="Custom", option_type=OptionType.CUSTOM, tenant=tenant),
+            ]
+        )
+        mandatory, optional, custom = options
 
         # Create selections
-        TaskPrioritySelection.objects.create(tenant=tenant, option=mandatory)
-        TaskPrioritySelection.objects.create(tenant=tenant, option=optional)
-        TaskPrioritySelection.objects.create(tenant=tenant, option=custom)
+        TaskPrioritySelection.objects.bulk_create([TaskPrioritySelection(tenant=tenant, option=o) for o in options])
 
-        form = self.TestUserFacingForm(tenant=tenant)
+        with django_assert_num_queries(0):
+            form = self.TestUserFacingForm(tenant=tenant)
 
         # Verify all types appear in queryset when selected
         priority_queryset = form.fields["priority"].queryset
@@ -1179,83 +1050,38 @@ class TestUserFacingFormMixin:
             },
         )
 
-        assert form.is_valid()
-        task = form.save()
+        with django_assert_num_queries(4):
+            assert form.is_valid()
+        with django_assert_num_queries(1):
+            task = form.save()
         assert task.priority == custom
 
-    def test_form_with_non_option_foreign_key(self):
+    def test_form_with_non_option_foreign_key(self, tenant):
         """Test form behavior with foreign key fields that aren't options."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class FormWithNonOptionFK(UserFacingFormMixin, forms.ModelForm):
-            """Test form with a non-option foreign key field."""
-
-            non_option_field = forms.ModelChoiceField(queryset=User.objects.all(), required=False)
-
-            class Meta:
-                """Meta class for form."""
-
-                model = Task
-                fields = ["title", "description", "priority", "non_option_field"]
-
         User.objects.create_user(username="testuser", password="testpass")
 
-        form = FormWithNonOptionFK(tenant=tenant)
+        form = self.FormWithNonOptionFK(tenant=tenant)
         # Verify non-option field's queryset is unaffected
         assert form.fields["non_option_field"].queryset.model == User
 
-    def test_disabled_field_for_deleted_selection_with_no_instance(self):
+    def test_disabled_field_for_deleted_selection_with_no_instance(self, tenant):
         """Test _handle_disabled_field_for_deleted_selection without instance."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class TestForm(UserFacingFormMixin, forms.ModelForm):
-            """Test form with disabled field for deleted selection."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = Task
-                fields = ["title", "description", "priority", "status", "user"]
-
-        form = TestForm(tenant=tenant)
+        form = self.TestUserFacingForm(tenant=tenant)
         # Force call to _handle_disabled_field_for_deleted_selection
         form._handle_disabled_field_for_deleted_selection(form.fields["priority"], None)  # Pass None as option
         assert "readonly" not in form.fields["priority"].widget.attrs
 
-    def test_handle_deleted_selection_with_no_instance_pk(self):
+    def test_handle_deleted_selection_with_no_instance_pk(self, tenant):
         """Test _handle_deleted_selection with instance but no pk."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
         task = Task(title="Test")  # Create instance without pk
 
-        class TestForm(UserFacingFormMixin, forms.ModelForm):
-            """Test form with handling of deleted selection."""
-
-            class Meta:
-                """Meta class for form."""
-
-                model = Task
-                fields = ["title", "description", "priority", "status", "user"]
-
-        form = TestForm(tenant=tenant, instance=task)
+        form = self.TestUserFacingForm(tenant=tenant, instance=task)
         # This should not raise an error
         form._handle_deleted_selection(form.fields["priority"], "priority")
 
-    def test_filter_foreign_key_fields_with_empty_queryset(self):
+    def test_filter_foreign_key_fields_with_empty_queryset(self, tenant):
         """Test filtering foreign key fields when queryset is None."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class TestForm(UserFacingFormMixin, forms.ModelForm):
-            """Test form with foreign key field with None queryset."""
-
-            empty_field = forms.ModelChoiceField(queryset=None)
-
-            class Meta:
-                """Meta class for form."""
-
-                model = Task
-                fields = ["title", "description", "priority", "status", "user"]
-
-        form = TestForm(tenant=tenant)
+        form = self.FormWithUnsetQueryset(tenant=tenant)
         # Should not raise an error for field with None queryset
         assert form.fields["empty_field"].queryset is None
 
@@ -1263,20 +1089,39 @@ class TestUserFacingFormMixin:
 class TestSelectionsForm:
     """Additional test cases for SelectionsForm."""
 
-    def test_selections_form_with_no_selections_field(self):
-        """Test form initialization when selections field is pre-defined."""
-        tenant = Tenant.objects.create(name="Test Tenant", subdomain="test-tenant")
-
-        class CustomSelectionsForm(SelectionsForm):
-            """Custom form with pre-defined selections field."""
+    class CustomSelectionsForm(SelectionsForm):
+        """Custom form with pre-defined selections field."""
 
-            selections = forms.ModelMultipleChoiceField(queryset=TaskPriorityOption.objects.none(), required=False)
+        selections = forms.ModelMultipleChoiceField(queryset=TaskPriorityOption.objects.none(), required=False)
 
-            class Meta:
-                """Meta class for form."""
+        class Meta:
+            """Meta class for form."""
 
-                model = TaskPrioritySelection
+            model = TaskPrioritySelection
 
-        form = CustomSelectionsForm(tenant=tenant)
+    def test_selections_form_with_no_selections_field(self, tenant):
+        """Test form initialization when selections field is pre-defined."""
+        form = self.CustomSelectionsForm(tenant=tenant)
         # Ensure the pre-defined selections field is used
         assert isinstance(form.fields["selections"], forms.ModelMultipleChoiceField)
+
+
+@pytest.mark.django_db
+class TestTaskForm:
+    """Test cases for the example app's TaskForm."""
+
+    def test_submitted_user_is_ignored(self, tenant, user):
+        """Test that a task is saved for the requesting user, whatever user id is submitted."""
+        request = RequestFactory().post("/")
+        request.user = user
+
+        form = TaskForm(
+            tenant=tenant,
+            request=request,
+            data={"title": "Test Task", "description": "Test Description", "user": 999},
+        )
+
+        assert form.is_valid(), form.errors
+        task = form.save()
+        assert task.user == user
+        assert Task.objects.filter(pk=task.pk, user=user).exists()
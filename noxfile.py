@@ -152,8 +152,9 @@ def tests(session: Session, django: str) -> None:
     """Run the test suite."""
     session.run("uv", "sync", "--prerelease=allow", "--extra=dev")
     try:
-
-        session.run("coverage", "run", "-m", "pytest", "-vv", *session.posargs)
+        # Each test module runs on a single worker, so tests that write migration files into the example app never
+        # run concurrently. pytest-django gives each worker its own test database.
+        session.run("pytest", "-vv", "-n", "auto", "--dist=loadfile", "--cov", "--cov-report=", *session.posargs)
     finally:
         if session.interactive:
             session.notify("coverage", posargs=[])
@@ -13,6 +13,7 @@ Here is what it should look like in the settings.py file of the project:
 
 import importlib
 import logging
+from functools import lru_cache
 
 from django_tenant_options.form_fields import (  # noqa: F401
     OptionsModelMultipleChoiceField,
@@ -37,8 +38,12 @@ if import_error:
     logger.error(import_error)
 
 
+@lru_cache(maxsize=128)
 def import_string(dotted_path):
-    """Import a dotted module path and return the attribute/class designated by the last name."""
+    """Import a dotted module path and return the attribute/class designated by the last name.
+
+    Results are cached by dotted path, so repeated lookups of the same class do not go through the import machinery.
+    """
     try:
         module_path, class_name = dotted_path.rsplit(".", 1)
     except ValueError as err:
@@ -63,39 +68,16 @@ class ModelClassConfig:
     """Configuration class for model base classes."""
 
     def __init__(self):
-        self._model_class = None
-        self._manager_class = None
-        self._queryset_class = None
-        self._foreignkey_class = None
-        self._onetoonefield_class = None
-        self._initialized = False
-
-    def _ensure_initialized(self):
-        """Ensure the configuration is initialized."""
-        if not self._initialized:
-            self._model_class = models.Model
-            self._manager_class = models.Manager
-            self._queryset_class = models.QuerySet
-            self._foreignkey_class = models.ForeignKey
-            self._onetoonefield_class = models.OneToOneField
-            self._initialized = True
+        """Start from Django's own base classes, which are replaced by any configured classes."""
+        self._model_class = models.Model
+        self._manager_class = models.Manager
+        self._queryset_class = models.QuerySet
+        self._foreignkey_class = models.ForeignKey
+        self._onetoonefield_class = models.OneToOneField
 
     def _import_string(self, dotted_path):
         """Import a dotted module path and return the attribute/class designated by the last name."""
-        try:
-            module_path, class_name = dotted_path.rsplit(".", 1)
-        except ValueError as err:
-            raise ImportError(f"{dotted_path} doesn't look like a module path") from err
-
-        try:
-            module = importlib.import_module(module_path)
-        except ImportError as err:
-            raise ImportError(f"Module {module_path} does not exist") from err
-
-        try:
-            return getattr(module, class_name)
-        except AttributeError as err:
-            raise ImportError(f"Module {module_path} does not define {class_name}") from err
+        return import_string(dotted_path)
 
     def _resolve_class(self, value):
         """Resolve a class from either a string path or direct class reference."""
@@ -106,62 +88,52 @@ class ModelClassConfig:
     @property
     def model_class(self):
         """The base class to use for all django-tenant-options models."""
-        self._ensure_initialized()
         return self._model_class
 
     @model_class.setter
     def model_class(self, value):
         """Set the base class to use for all django-tenant-options models."""
         self._model_class = self._resolve_class(value)
-        self._initialized = True
 
     @property
     def manager_class(self):
         """The base class to use for all django-tenant-options model managers."""
-        self._ensure_initialized()
         return self._manager_class
 
     @manager_class.setter
     def manager_class(self, value):
         """Set the base class to use for all django-tenant-options model managers."""
         self._manager_class = self._resolve_class(value)
-        self._initialized = True
 
     @property
     def queryset_class(self):
         """The base class to use for all django-tenant-options model querysets."""
-        self._ensure_initialized()
         return self._queryset_class
 
     @queryset_class.setter
     def queryset_class(self, value):
         """Set the base class to use for all django-tenant-options model querysets."""
         self._queryset_class = self._resolve_class(value)
-        self._initialized = True
 
     @property
     def foreignkey_class(self):
         """The base class to use for all django-tenant-options foreign keys."""
-        self._ensure_initialized()
         return self._foreignkey_class
 
     @foreignkey_class.setter
     def foreignkey_class(self, value):
         """Set the base class to use for all django-tenant-options foreign keys."""
         self._foreignkey_class = self._resolve_class(value)
-        self._initialized = True
 
     @property
     def onetoonefield_class(self):
         """The base class to use for all django-tenant-options one-to-one fields."""
-        self._ensure_initialized()
         return self._onetoonefield_class
 
     @onetoonefield_class.setter
     def onetoonefield_class(self, value):
         """Set the base class to use for all django-tenant-options one-to-one fields."""
         self._onetoonefield_class = self._resolve_class(value)
-        self._initialized = True
 
 
 # Global config instance for django-tenant-options models
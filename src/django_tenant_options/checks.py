@@ -1,7 +1,5 @@
 """Checks for the django_tenant_options app."""
 
-import inspect
-
 from django.core.checks import Error
 from django.core.checks import Warning
 
@@ -9,10 +7,8 @@ from django.core.checks import Warning
 def check_manager_compliance(model, manager, required_manager, required_queryset, error_ids):
     """Helper function to check if a manager complies with requirements."""
     results = []
-    manager_mro = inspect.getmro(manager.__class__)
-    queryset_mro = inspect.getmro(manager._queryset_class)
 
-    if required_manager not in manager_mro:
+    if not issubclass(manager.__class__, required_manager):
         results.append(
             Warning(
                 f"Model manager '{manager.__class__.__name__}' does not inherit from '{required_manager.__name__}', "
@@ -21,7 +17,7 @@ def check_manager_compliance(model, manager, required_manager, required_queryset
                 id=f"django_tenant_options.I{error_ids[0]}",
             )
         )
-    elif required_queryset not in queryset_mro:
+    elif not issubclass(manager._queryset_class, required_queryset):
         results.append(
             Error(
                 f"Manager {manager.__class__.__name__} must use a queryset that inherits from "
@@ -387,31 +387,30 @@ class Command(BaseCommand):
 
         last_migration_name = last_migration.name if last_migration else None
 
-        operations = []
-        for trigger in triggers:
-            operations.append(
-                f"        migrations.RunSQL(\n"
-                f"            sql='DROP TRIGGER IF EXISTS {trigger.trigger_name};',\n"
-                f"            reverse_sql='',  # No reverse operation as this removes triggers\n"
-                f"        ),"
-            )
+        # The operations are appended after the template is dedented, so their own indentation is kept as written
+        operations = "\n".join(
+            f"        migrations.RunSQL(\n"
+            f"            sql='DROP TRIGGER IF EXISTS {trigger.trigger_name};',\n"
+            f"            reverse_sql='',  # No reverse operation as this removes triggers\n"
+            f"        ),"
+            for trigger in triggers
+        )
 
-        return dedent(
+        header = dedent(
             f"""\
-        # Generated by django-tenant-options on {timestamp}
+            # Generated by django-tenant-options on {timestamp}
 
-        from django.db import migrations
+            from django.db import migrations
 
 
-        class Migration(migrations.Migration):
-            \"\"\"Removes triggers previously created by django-tenant-options.\"\"\"
+            class Migration(migrations.Migration):
+                \"\"\"Removes triggers previously created by django-tenant-options.\"\"\"
 
-            dependencies = [
-                ('{app_label}', '{last_migration_name}'),
-            ]
+                dependencies = [
+                    ('{app_label}', '{last_migration_name}'),
+                ]
 
-            operations = [
-        {"".join(operations)}
-            ]
-        """
+                operations = [
+            """
         )
+        return f"{header}{operations}\n    ]\n"
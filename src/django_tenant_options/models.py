@@ -496,11 +496,12 @@ class OptionManager(model_config.manager_class):
 
         updated_options = {}
         default_options = getattr(self.model, "default_options", {})
+        update_or_create_default_option = self.model.objects._update_or_create_default_option
 
         # Create or update default options
         for name, options_dict in default_options.items():
             try:
-                self.model.objects._update_or_create_default_option(name, options_dict)
+                update_or_create_default_option(name, options_dict)
                 updated_options[name] = options_dict
             except Exception as e:  # pylint: disable=W0718
                 logger.error("Error updating option %s: %s", name, e)